@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Publisher Benchmark
+
+Measures how fast messages go from a SimplePublisher to a Python listener over
+LocalTransport, comparing a per-message publish() loop with publish_many().
+
+The module is fully type-annotated so that mypyc can compile it, which takes
+the listener callback and the publish loops out of the interpreter:
+
+    uv run --with mypy mypyc benchmarks/benchmark_publisher.py
+    uv run python -c "import benchmark_publisher; benchmark_publisher.main()"
+
+Without compiling, it runs as a plain script:
+
+    uv run python benchmarks/benchmark_publisher.py --messages 10000
+"""
+
+import argparse
+import time
+from threading import Event
+from typing import Callable, List, Optional
+
+from up_py_rs import StaticUriProvider, UMessage
+from up_py_rs.communication import SimplePublisher, UPayload
+from up_py_rs.local_transport import LocalTransport
+
+RESOURCE_ID = 0x8001
+
+
+class CountingListener:
+    """Listener that counts string messages and signals once all have arrived."""
+
+    def __init__(self, expected: int) -> None:
+        self.expected = expected
+        self.received = 0
+        self.done = Event()
+
+    def __call__(self, msg: UMessage) -> None:
+        if msg.extract_string() is not None:
+            self.received += 1
+            if self.received == self.expected:
+                self.done.set()
+
+
+def publish_loop(publisher: SimplePublisher, messages: int) -> None:
+    """Publish one message per call."""
+    for i in range(messages):
+        publisher.publish(RESOURCE_ID, UPayload.from_string(f"Message #{i}"))
+
+
+def publish_batched(publisher: SimplePublisher, messages: int) -> None:
+    """Publish all messages in a single call."""
+    payloads: List[Optional[UPayload]] = [
+        UPayload.from_string(f"Message #{i}") for i in range(messages)
+    ]
+    publisher.publish_many(RESOURCE_ID, payloads)
+
+
+def run(name: str, messages: int, publish: Callable[[SimplePublisher, int], None]) -> float:
+    """Time one publish strategy until every message has been delivered."""
+    uri_provider = StaticUriProvider("bench-vehicle", 0xa34b, 0x01)
+    transport = LocalTransport()
+    listener = CountingListener(messages)
+    handle = transport.register_listener(uri_provider, RESOURCE_ID, listener)
+    publisher = SimplePublisher(transport, uri_provider)
+
+    start = time.perf_counter()
+    publish(publisher, messages)
+    delivered = listener.done.wait(timeout=30.0)
+    elapsed = time.perf_counter() - start
+
+    transport.unregister_listener(handle)
+    if not delivered:
+        print(f"{name:<10} only {listener.received} of {messages} messages delivered")
+    else:
+        print(f"{name:<10} {messages} messages in {elapsed:.3f}s ({messages / elapsed:,.0f} msg/s)")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SimplePublisher over LocalTransport")
+    parser.add_argument("--messages", type=int, default=10000, help="messages per run")
+    args = parser.parse_args()
+    messages: int = args.messages
+
+    print("uProtocol Publisher Benchmark")
+    print("=" * 60)
+    run("publish", messages, publish_loop)
+    run("batched", messages, publish_batched)
+
+
+if __name__ == "__main__":
+    main()
@@ -35,7 +35,7 @@ def main():
     topic = uri_provider.get_resource_uri(ORIGIN_RESOURCE_ID)
     
     print("Starting to listen for notifications...")
-    notifier.start_listening(topic, console_printer)
+    handle = notifier.start_listening(topic, console_printer)
     
     payload = UPayload.from_string("Hello from Python!")
     
@@ -45,7 +45,7 @@ def main():
     
     # Stop listening (cleanup)
     print("Stopping listener...")
-    notifier.stop_listening(topic, console_printer)
+    notifier.stop_listening(handle)
     
     print("Done!")
 
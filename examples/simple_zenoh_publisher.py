@@ -11,6 +11,18 @@ This example shows:
 2. Creating a URI provider for the publishing entity
 3. Creating a publisher that works with Zenoh transport
 4. Publishing messages over the network using Zenoh protocol
+5. Publishing numeric telemetry without formatting it as strings
+
+Zenoh modes (set with UPTransportZenoh.builder(...).mode(...)):
+- "peer":   Zenoh's default. Sessions connect directly to each other, with
+            no extra hop. Peers find each other through multicast scouting,
+            or through endpoints set with .listen(...) / .connect(...).
+- "client": every message goes through a Zenoh router. This adds a hop, but
+            works when peers cannot reach each other directly.
+- "router": this process acts as the router for others.
+This example and the subscriber example run as peers and rely on multicast
+scouting. If it is unavailable on your network, have the subscriber
+.listen("tcp/127.0.0.1:7447") and this publisher .connect(...) to it.
 """
 
 import time
@@ -40,21 +52,31 @@ def main():
     publisher = SimplePublisher(transport, uri_provider)
     print("   ✓ Publisher created successfully")
     
+    # Zenoh delivery is best-effort: messages sent before the subscriber has
+    # been discovered are dropped, so give scouting a moment first
+    time.sleep(1)
+    
     # Publish messages
     print("\n4. Publishing messages...")
     resource_id = 0x8001
     
-    # Publish 5 messages
-    for i in range(5):
-        message = f"Hello from Zenoh publisher! Message #{i+1}"
-        payload = UPayload.from_string(message)
-        
+    # Publish 5 messages in a single call
+    messages = [f"Hello from Zenoh publisher! Message #{i+1}" for i in range(5)]
+    for message in messages:
         print(f"   📤 Publishing: {message}")
-        publisher.publish(resource_id, payload)
-        
-        time.sleep(1)  # Wait 1 second between messages
+    publisher.publish_many(resource_id, [UPayload.from_string(m) for m in messages])
+    
+    # Numeric telemetry is packed on the Rust side, no f-string per message
+    counter_resource_id = 0x8002
+    print("\n5. Publishing numeric payloads...")
+    publisher.publish_many(counter_resource_id, [UPayload.from_u32(i) for i in range(5)])
+    publisher.publish(counter_resource_id, UPayload.from_struct("<Id", 5, 21.5))
+    print(f"   📤 Published counters 0-4 and a (counter, reading) record to {hex(counter_resource_id)}")
+    
+    # Let the session flush queued messages before the process exits
+    time.sleep(1)
     
-    print("\n✓ Successfully published 5 messages via Zenoh!")
+    print("\n✓ Successfully published all messages via Zenoh!")
     print("\nTo receive these messages, run:")
     print("  uv run python examples/simple_zenoh_subscriber.py")
     print("\n" + "=" * 60)
@@ -1,20 +1,28 @@
 #!/usr/bin/env python3
 """
-Test script to run publisher and subscriber simultaneously.
+Zenoh Publisher/Subscriber Demo
+
+Runs simple_zenoh_subscriber.py and simple_zenoh_publisher.py as two separate
+processes to show communication across process boundaries. The automated
+equivalent lives in tests/test_zenoh_transport.py and runs both ends in one
+process.
 """
 
+import os
 import subprocess
 import time
 import sys
 
+EXAMPLES_DIR = os.path.dirname(os.path.abspath(__file__))
+
 def main():
-    print("Testing Zenoh Publisher/Subscriber Communication")
+    print("Zenoh Publisher/Subscriber Demo")
     print("=" * 70)
     
     # Start subscriber in background
     print("\n1. Starting subscriber...")
     subscriber = subprocess.Popen(
-        ["uv", "run", "python", "examples/simple_zenoh_subscriber.py"],
+        ["uv", "run", "python", os.path.join(EXAMPLES_DIR, "simple_zenoh_subscriber.py")],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
@@ -28,7 +36,7 @@ def main():
     # Run publisher
     print("\n2. Running publisher...")
     publisher_result = subprocess.run(
-        ["uv", "run", "python", "examples/simple_zenoh_publisher.py"],
+        ["uv", "run", "python", os.path.join(EXAMPLES_DIR, "simple_zenoh_publisher.py")],
         capture_output=True,
         text=True
     )
@@ -54,7 +62,7 @@ def main():
         print("Subscriber errors:", subscriber_err, file=sys.stderr)
     
     print("\n" + "=" * 70)
-    print("Test completed!")
+    print("Demo completed!")
 
 if __name__ == "__main__":
     main()
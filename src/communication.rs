@@ -4,18 +4,23 @@ use up_rust::communication::{
     SimpleNotifier as RustSimpleNotifier, Notifier
 };
 use up_rust::{
-    LocalUriProvider, StaticUriProvider as RustStaticUriProvider, UListener,
-    UMessage as RustUMessage, UTransport, local_transport::LocalTransport as RustLocalTransport,
+    LocalUriProvider, StaticUriProvider as RustStaticUriProvider, UListener, UPriority, UTransport,
+    local_transport::LocalTransport as RustLocalTransport,
 };
 
+use bytes::{BufMut, Bytes, BytesMut};
 use protobuf::well_known_types::wrappers::StringValue;
-use pyo3::exceptions::PyException;
+use pyo3::exceptions::{PyException, PyTypeError};
 use pyo3::prelude::*;
-use pyo3::types::PyAny;
-use std::collections::HashMap;
+use pyo3::intern;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyAny, PyByteArray, PyBytes, PyList, PyTuple, PyType};
 use std::sync::{Arc, Mutex};
 
-use crate::local_transport::{LocalTransport, StaticUriProvider, UUri};
+use crate::local_transport::{
+    warn_unregister_by_callback, ListenerHandle, ListenerRegistry, LocalTransport, PythonListener,
+    StaticUriProvider, UUri,
+};
 
 #[cfg(feature = "zenoh")]
 use crate::zenoh_transport::UPTransportZenoh;
@@ -79,25 +84,407 @@ impl UPayload {
         Ok(UPayload { inner: payload })
     }
 
+    /// Create a plain-text UPayload from a string value.
+    ///
+    /// The string is carried as UTF-8 bytes with format UPAYLOAD_FORMAT_TEXT,
+    /// without the protobuf envelope used by ``from_string``. Receivers read it
+    /// with ``extract_string()`` without any protobuf decoding. Use
+    /// ``from_string`` when the receiving side expects a protobuf StringValue.
+    ///
+    /// Args:
+    ///     value (str): The text to carry in the payload.
+    ///
+    /// Returns:
+    ///     UPayload: A new payload instance containing the text.
+    ///
+    /// Example:
+    ///     >>> payload = up_py_rs.UPayload.from_text("Hello, World!")
+    #[staticmethod]
+    fn from_text(value: String) -> Self {
+        UPayload {
+            inner: RustUPayload::new(value.into_bytes(), UPayloadFormat::UPAYLOAD_FORMAT_TEXT),
+        }
+    }
+
     /// Create a UPayload from raw bytes.
     ///
     /// Args:
-    ///     data (list[int]): A list of bytes (0-255) to wrap in the payload.
+    ///     data (bytes | bytearray | memoryview | list[int]): The binary data to wrap
+    ///         in the payload. A ``bytes`` object is shared without copying, a
+    ///         bytearray or memoryview is copied in a single block, and a list of
+    ///         ints (0-255) is still accepted but converted item by item.
+    ///         Wrap other buffer exporters (``array.array``, numpy arrays) in a
+    ///         ``memoryview`` first.
     ///
     /// Returns:
-    ///     UPayload: A new payload instance containing the binary data.
+    ///     UPayload: A new payload instance with format UPAYLOAD_FORMAT_RAW, the
+    ///               same format ``SimplePublisher.publish_bytes`` sends.
+    ///
+    /// Raises:
+    ///     TypeError: If data is not bytes, bytearray, memoryview or a list.
+    ///     Exception: If a list item is not an int in range 0-255.
     ///
     /// Example:
-    ///     >>> payload = up_py_rs.UPayload.from_bytes([72, 101, 108, 108, 111])
+    ///     >>> payload = up_py_rs.UPayload.from_bytes(b"Hello")
     #[staticmethod]
-    fn from_bytes(data: Vec<u8>) -> PyResult<Self> {
-        // Create a simple bytes payload with a generic format
-        Ok(UPayload {
-            inner: RustUPayload::new(
-                data,
-                UPayloadFormat::UPAYLOAD_FORMAT_PROTOBUF_WRAPPED_IN_ANY,
-            ),
-        })
+    fn from_bytes(data: &PyAny) -> PyResult<Self> {
+        Ok(UPayload::raw(extract_payload_bytes(data)?))
+    }
+
+    /// Create a raw UPayload holding an unsigned 32-bit integer.
+    ///
+    /// The value is written as 4 little-endian bytes, with no string formatting
+    /// involved. Receivers read it back with
+    /// ``struct.unpack("<I", msg.extract_bytes())``.
+    ///
+    /// Args:
+    ///     value (int): The integer to send (0 to 2^32-1).
+    ///
+    /// Returns:
+    ///     UPayload: A new payload instance with format UPAYLOAD_FORMAT_RAW.
+    ///
+    /// Example:
+    ///     >>> payload = up_py_rs.UPayload.from_u32(42)
+    #[staticmethod]
+    fn from_u32(value: u32) -> Self {
+        UPayload::raw(Bytes::copy_from_slice(&value.to_le_bytes()))
+    }
+
+    /// Create a raw UPayload holding a 64-bit float.
+    ///
+    /// The value is written as 8 little-endian bytes. Receivers read it back
+    /// with ``struct.unpack("<d", msg.extract_bytes())``.
+    ///
+    /// Args:
+    ///     value (float): The number to send.
+    ///
+    /// Returns:
+    ///     UPayload: A new payload instance with format UPAYLOAD_FORMAT_RAW.
+    ///
+    /// Example:
+    ///     >>> payload = up_py_rs.UPayload.from_f64(21.5)
+    #[staticmethod]
+    fn from_f64(value: f64) -> Self {
+        UPayload::raw(Bytes::copy_from_slice(&value.to_le_bytes()))
+    }
+
+    /// Create a raw UPayload by packing values according to a format string.
+    ///
+    /// The format follows the ``struct`` module: a byte order prefix (``<``
+    /// little-endian, ``>`` or ``!`` big-endian, ``=`` native) followed by
+    /// format characters, each optionally preceded by a repeat count. Values
+    /// use standard sizes with no alignment padding, so the bytes match
+    /// ``struct.pack`` with the same format. Supported characters are
+    /// ``x b B ? h H i I l L q Q f d s``. The prefix is required: ``struct``'s
+    /// default native ``@`` layout adds alignment padding and is not supported.
+    ///
+    /// Args:
+    ///     fmt (str): The format string.
+    ///     *args: The values to pack, one per format character (``x`` takes none).
+    ///
+    /// Returns:
+    ///     UPayload: A new payload instance with format UPAYLOAD_FORMAT_RAW.
+    ///
+    /// Raises:
+    ///     Exception: If the format has no byte order prefix, is invalid, or does
+    ///         not match the arguments.
+    ///
+    /// Example:
+    ///     >>> payload = up_py_rs.UPayload.from_struct("<Id", 7, 21.5)
+    #[staticmethod]
+    #[pyo3(signature = (fmt, *args))]
+    fn from_struct(fmt: &str, args: &PyTuple) -> PyResult<Self> {
+        Ok(UPayload::raw(pack_struct(fmt, args)?.freeze()))
+    }
+}
+
+impl UPayload {
+    fn raw(data: Bytes) -> Self {
+        UPayload {
+            inner: RustUPayload::new(data, UPayloadFormat::UPAYLOAD_FORMAT_RAW),
+        }
+    }
+}
+
+/// Write `value` with the given byte order using the matching BufMut methods.
+macro_rules! put_ordered {
+    ($buf:expr, $little_endian:expr, $value:expr, $put_le:ident, $put_be:ident) => {
+        if $little_endian {
+            $buf.$put_le($value)
+        } else {
+            $buf.$put_be($value)
+        }
+    };
+}
+
+/// Take the argument for the next format character.
+fn next_arg<'py>(values: &mut impl Iterator<Item = &'py PyAny>, code: char) -> PyResult<&'py PyAny> {
+    values.next().ok_or_else(|| {
+        PyException::new_err(format!("Not enough arguments for format character '{}'", code))
+    })
+}
+
+/// Pack Python values into a buffer following a `struct`-style format string.
+fn pack_struct(fmt: &str, args: &PyTuple) -> PyResult<BytesMut> {
+    let mut codes = fmt.chars().peekable();
+    let little_endian = match codes.peek() {
+        Some('<') => {
+            codes.next();
+            true
+        }
+        Some('>') | Some('!') => {
+            codes.next();
+            false
+        }
+        Some('=') => {
+            codes.next();
+            cfg!(target_endian = "little")
+        }
+        _ => {
+            // struct defaults to native '@' with alignment padding, which is not implemented
+            return Err(PyException::new_err(format!(
+                "Format '{}' needs an explicit byte order prefix ('<', '>', '!' or '='); \
+                 native '@' layout with alignment padding is not supported",
+                fmt
+            )));
+        }
+    };
+
+    let mut buf = BytesMut::new();
+    let mut values = args.iter();
+    let mut count: Option<usize> = None;
+
+    for code in codes {
+        if code.is_whitespace() {
+            continue;
+        }
+        if let Some(digit) = code.to_digit(10) {
+            count = Some(count.unwrap_or(0) * 10 + digit as usize);
+            continue;
+        }
+        let repeat = count.take().unwrap_or(1);
+        match code {
+            // For strings the count is the field width, padded or truncated like struct.pack
+            's' => {
+                let data: &[u8] = next_arg(&mut values, code)?.extract()?;
+                let len = data.len().min(repeat);
+                buf.put_slice(&data[..len]);
+                buf.put_bytes(0, repeat - len);
+            }
+            'x' => buf.put_bytes(0, repeat),
+            _ => {
+                for _ in 0..repeat {
+                    let value = next_arg(&mut values, code)?;
+                    match code {
+                        'b' => buf.put_i8(value.extract()?),
+                        'B' => buf.put_u8(value.extract()?),
+                        '?' => buf.put_u8(value.is_true()? as u8),
+                        'h' => put_ordered!(buf, little_endian, value.extract()?, put_i16_le, put_i16),
+                        'H' => put_ordered!(buf, little_endian, value.extract()?, put_u16_le, put_u16),
+                        'i' | 'l' => put_ordered!(buf, little_endian, value.extract()?, put_i32_le, put_i32),
+                        'I' | 'L' => put_ordered!(buf, little_endian, value.extract()?, put_u32_le, put_u32),
+                        'q' => put_ordered!(buf, little_endian, value.extract()?, put_i64_le, put_i64),
+                        'Q' => put_ordered!(buf, little_endian, value.extract()?, put_u64_le, put_u64),
+                        'f' => put_ordered!(buf, little_endian, value.extract()?, put_f32_le, put_f32),
+                        'd' => put_ordered!(buf, little_endian, value.extract()?, put_f64_le, put_f64),
+                        _ => {
+                            return Err(PyException::new_err(format!(
+                                "Unsupported format character '{}'",
+                                code
+                            )))
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    if count.is_some() {
+        return Err(PyException::new_err("Repeat count given without format character"));
+    }
+    if values.next().is_some() {
+        return Err(PyException::new_err(format!(
+            "Too many arguments for format '{}'",
+            fmt
+        )));
+    }
+    Ok(buf)
+}
+
+/// Map a priority name to the uProtocol priority class set on outgoing messages.
+///
+/// Accepts the Zenoh priority names as well as the uProtocol class names
+/// (``"CS0"`` to ``"CS6"``). The Zenoh transport maps the class back onto the
+/// matching Zenoh priority when it puts the message on the wire.
+fn parse_priority(priority: &str) -> PyResult<UPriority> {
+    match priority {
+        "Background" | "CS0" => Ok(UPriority::UPRIORITY_CS0),
+        "DataLow" | "CS1" => Ok(UPriority::UPRIORITY_CS1),
+        "Data" | "CS2" => Ok(UPriority::UPRIORITY_CS2),
+        "DataHigh" | "CS3" => Ok(UPriority::UPRIORITY_CS3),
+        "InteractiveLow" | "CS4" => Ok(UPriority::UPRIORITY_CS4),
+        "InteractiveHigh" | "CS5" => Ok(UPriority::UPRIORITY_CS5),
+        "RealTime" | "CS6" => Ok(UPriority::UPRIORITY_CS6),
+        _ => Err(PyException::new_err(format!(
+            "Invalid priority '{}': expected one of Background, DataLow, Data, DataHigh, \
+             InteractiveLow, InteractiveHigh, RealTime (or CS0-CS6)",
+            priority
+        ))),
+    }
+}
+
+/// A `bytes` object used as the backing store of a `Bytes` buffer.
+///
+/// Python bytes are immutable and their data lives inside the object, so the
+/// slice taken while holding the GIL stays valid for as long as the object does.
+struct PyBytesOwner {
+    _obj: Py<PyBytes>,
+    ptr: *const u8,
+    len: usize,
+}
+
+// SAFETY: the data behind `ptr` is immutable and kept alive by `_obj`.
+unsafe impl Send for PyBytesOwner {}
+unsafe impl Sync for PyBytesOwner {}
+
+impl PyBytesOwner {
+    fn new(bytes: &PyBytes) -> Self {
+        let data = bytes.as_bytes();
+        PyBytesOwner {
+            _obj: bytes.into(),
+            ptr: data.as_ptr(),
+            len: data.len(),
+        }
+    }
+}
+
+impl AsRef<[u8]> for PyBytesOwner {
+    fn as_ref(&self) -> &[u8] {
+        unsafe { std::slice::from_raw_parts(self.ptr, self.len) }
+    }
+}
+
+static MEMORYVIEW_TYPE: GILOnceCell<Py<PyType>> = GILOnceCell::new();
+
+/// Turn a bytes-like object, or a list of ints, into a payload buffer.
+///
+/// A `bytes` object is used as the buffer directly, without copying. Every
+/// other accepted type is copied exactly once: a memoryview is exported with
+/// `tobytes()` (C order, raw item bytes) and that bytes object becomes the
+/// buffer. Other buffer exporters such as `array.array` or numpy arrays must
+/// be wrapped in a memoryview explicitly.
+fn extract_payload_bytes(data: &PyAny) -> PyResult<Bytes> {
+    let py = data.py();
+    if let Ok(bytes) = data.downcast::<PyBytes>() {
+        return Ok(Bytes::from_owner(PyBytesOwner::new(bytes)));
+    }
+    if let Ok(byte_array) = data.downcast::<PyByteArray>() {
+        return Ok(Bytes::from(byte_array.to_vec()));
+    }
+    let memoryview = MEMORYVIEW_TYPE.get_or_try_init(py, || -> PyResult<_> {
+        let memoryview = py.import("builtins")?.getattr(intern!(py, "memoryview"))?;
+        Ok(memoryview.downcast::<PyType>()?.into())
+    })?;
+    if data.is_instance(memoryview.as_ref(py))? {
+        let exported = data.call_method0(intern!(py, "tobytes"))?;
+        return Ok(Bytes::from_owner(PyBytesOwner::new(exported.downcast::<PyBytes>()?)));
+    }
+    if data.downcast::<PyList>().is_ok() {
+        return Ok(Bytes::from(data.extract::<Vec<u8>>()?));
+    }
+    Err(PyTypeError::new_err(format!(
+        "Expected bytes, bytearray, memoryview or a list of ints, got {}",
+        data.get_type().name()?
+    )))
+}
+
+/// Reusable buffer for building raw payloads.
+///
+/// UPayloadBuilder keeps one growable buffer across messages. Each call to
+/// `finish()` hands the written bytes to a new UPayload without copying and
+/// leaves the builder empty, ready for the next message.
+#[pyclass]
+pub struct UPayloadBuilder {
+    buf: BytesMut,
+    /// Set once `write_bytes` is used; the payload is then RAW instead of TEXT.
+    binary: bool,
+}
+
+#[pymethods]
+impl UPayloadBuilder {
+    /// Create a new UPayloadBuilder.
+    ///
+    /// Args:
+    ///     capacity (int): Initial buffer size in bytes (default 64).
+    ///
+    /// Returns:
+    ///     UPayloadBuilder: A new, empty builder.
+    ///
+    /// Example:
+    ///     >>> builder = up_py_rs.UPayloadBuilder(64)
+    #[new]
+    #[pyo3(signature = (capacity=64))]
+    fn new(capacity: usize) -> Self {
+        UPayloadBuilder {
+            buf: BytesMut::with_capacity(capacity),
+            binary: false,
+        }
+    }
+
+    /// Discard anything written since the last `finish()`.
+    fn reset(&mut self) {
+        self.buf.clear();
+        self.binary = false;
+    }
+
+    /// Append the UTF-8 encoding of a string.
+    ///
+    /// Args:
+    ///     value (str): The text to append.
+    fn write_str(&mut self, value: &str) {
+        self.buf.extend_from_slice(value.as_bytes());
+    }
+
+    /// Append raw bytes.
+    ///
+    /// Args:
+    ///     data (bytes | bytearray | memoryview | list[int]): The bytes to append.
+    ///         Accepts the same types as ``UPayload.from_bytes``.
+    fn write_bytes(&mut self, data: &PyAny) -> PyResult<()> {
+        self.buf.extend_from_slice(&extract_payload_bytes(data)?);
+        self.binary = true;
+        Ok(())
+    }
+
+    /// Turn the written bytes into a UPayload and empty the builder.
+    ///
+    /// If only `write_str` was used, the payload has format UPAYLOAD_FORMAT_TEXT,
+    /// like one created with `UPayload.from_text`, so `UMessage.extract_string()`
+    /// and `StringListener` see the text. Once `write_bytes` has been called the
+    /// payload has format UPAYLOAD_FORMAT_RAW.
+    ///
+    /// Returns:
+    ///     UPayload: A payload holding the bytes written since the last `finish()`.
+    ///
+    /// Example:
+    ///     >>> builder = up_py_rs.UPayloadBuilder(64)
+    ///     >>> for i in range(5):
+    ///     ...     builder.write_str(f"msg {i}")
+    ///     ...     publisher.publish(0xb4c1, builder.finish())
+    fn finish(&mut self) -> UPayload {
+        let format = if self.binary {
+            UPayloadFormat::UPAYLOAD_FORMAT_RAW
+        } else {
+            UPayloadFormat::UPAYLOAD_FORMAT_TEXT
+        };
+        self.binary = false;
+        UPayload {
+            inner: RustUPayload::new(self.buf.split().freeze(), format),
+        }
+    }
+
+    fn __len__(&self) -> usize {
+        self.buf.len()
     }
 }
 
@@ -106,6 +493,9 @@ impl UPayload {
 /// SimplePublisher provides an easy-to-use interface for publishing messages
 /// to specific resources in the uProtocol network. It works with any transport
 /// implementation (LocalTransport, UPTransportZenoh, etc.).
+///
+/// The GIL is released while messages are sent, so other Python threads keep
+/// running during network I/O.
 #[pyclass]
 pub struct SimplePublisher {
     transport: TransportType,
@@ -161,51 +551,199 @@ impl SimplePublisher {
     /// Args:
     ///     resource_id (int): The target resource ID (0 to 65535).
     ///     payload (UPayload | None): The message payload, or None for empty messages.
+    ///     priority (str | None): Optional message priority, one of ``"Background"``,
+    ///         ``"DataLow"``, ``"Data"``, ``"DataHigh"``, ``"InteractiveLow"``,
+    ///         ``"InteractiveHigh"`` or ``"RealTime"`` (``"CS0"`` to ``"CS6"`` are
+    ///         accepted too). Defaults to the transport's default priority.
     ///
     /// Raises:
-    ///     Exception: If publishing fails.
+    ///     Exception: If the priority is unknown or publishing fails.
     ///
     /// Example:
     ///     >>> payload = up_py_rs.UPayload.from_string("Hello")
     ///     >>> publisher.publish(0xb4c1, payload)
     ///     >>> # Or publish without payload:
     ///     >>> publisher.publish(0xb4c1, None)
+    ///     >>> # Latency-sensitive messages can raise their priority:
+    ///     >>> publisher.publish(0xb4c1, payload, priority="RealTime")
+    #[pyo3(signature = (resource_id, payload, priority=None))]
     fn publish(
-        &mut self,
-        _py: Python,
+        &self,
+        py: Python,
         resource_id: u16,
         payload: Option<UPayload>,
+        priority: Option<&str>,
     ) -> PyResult<()> {
-        let payload_inner = payload.map(|p| p.inner);
-        let call_options = CallOptions::for_publish(None, None, None);
-        let transport_arc = self.transport.as_transport_arc();
-        let uri_provider = self.uri_provider.clone();
+        let priority = priority.map(parse_priority).transpose()?;
+        self.publish_all(py, vec![(resource_id, payload.map(|p| p.inner))], priority)
+    }
 
-        self.runtime.block_on(async move {
-            let publisher = RustSimplePublisher::new(transport_arc, uri_provider);
-            publisher
-                .publish(resource_id, call_options, payload_inner)
-                .await
-                .map_err(|e| PyException::new_err(format!("Failed to publish: {}", e)))
-        })
+    /// Publish raw bytes to a specific resource.
+    ///
+    /// The bytes are sent as a UPAYLOAD_FORMAT_RAW payload without creating an
+    /// intermediate UPayload object.
+    ///
+    /// Args:
+    ///     resource_id (int): The target resource ID (0 to 65535).
+    ///     data (bytes | bytearray | memoryview): The payload bytes.
+    ///     priority (str | None): Optional message priority, using the same names as
+    ///         ``publish``.
+    ///
+    /// Raises:
+    ///     TypeError: If data is not bytes-like.
+    ///     Exception: If the priority is unknown or publishing fails.
+    ///
+    /// Example:
+    ///     >>> publisher.publish_bytes(0xb4c1, b"Hello")
+    #[pyo3(signature = (resource_id, data, priority=None))]
+    fn publish_bytes(
+        &self,
+        py: Python,
+        resource_id: u16,
+        data: &PyAny,
+        priority: Option<&str>,
+    ) -> PyResult<()> {
+        let priority = priority.map(parse_priority).transpose()?;
+        let payload = UPayload::raw(extract_payload_bytes(data)?).inner;
+        self.publish_all(py, vec![(resource_id, Some(payload))], priority)
     }
-}
 
-/// Internal struct to bridge Python callbacks to Rust UListener trait for notifications
-struct PythonNotificationListener {
-    callback: PyObject,
+    /// Publish several messages to the same resource in a single call.
+    ///
+    /// All payloads are sent in order without returning to Python between
+    /// messages, so consecutive messages can share a transport batch.
+    ///
+    /// Args:
+    ///     resource_id (int): The target resource ID (0 to 65535).
+    ///     payloads (Iterable[UPayload | None]): The payloads to publish, in order.
+    ///         Any iterable works, including generators; it is consumed before
+    ///         the first message is sent.
+    ///     priority (str | None): Optional message priority, using the same names as
+    ///         ``publish``. Applies to every message in the call.
+    ///
+    /// Raises:
+    ///     Exception: If the priority is unknown, or if publishing any of the
+    ///                messages fails. Messages before the failing one have
+    ///                already been sent.
+    ///
+    /// Example:
+    ///     >>> payloads = [up_py_rs.UPayload.from_string(f"Hello #{i}") for i in range(5)]
+    ///     >>> publisher.publish_many(0xb4c1, payloads)
+    #[pyo3(signature = (resource_id, payloads, priority=None))]
+    fn publish_many(
+        &self,
+        py: Python,
+        resource_id: u16,
+        payloads: &PyAny,
+        priority: Option<&str>,
+    ) -> PyResult<()> {
+        let priority = priority.map(parse_priority).transpose()?;
+        let messages = payloads
+            .iter()?
+            .map(|payload| {
+                let payload: Option<UPayload> = payload?.extract()?;
+                Ok((resource_id, payload.map(|p| p.inner)))
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        self.publish_all(py, messages, priority)
+    }
+
+    /// Publish a batch of messages, each to its own resource, in a single call.
+    ///
+    /// Args:
+    ///     messages (list[tuple[int, UPayload | None]]): The ``(resource_id, payload)``
+    ///                                                   pairs to publish, in order.
+    ///     priority (str | None): Optional message priority, using the same names as
+    ///         ``publish``. Applies to every message in the call.
+    ///
+    /// Raises:
+    ///     Exception: If the priority is unknown, or if publishing any of the
+    ///                messages fails. Messages before the failing one have
+    ///                already been sent.
+    ///
+    /// Example:
+    ///     >>> publisher.publish_batch([
+    ///     ...     (0xb4c1, up_py_rs.UPayload.from_string("speed")),
+    ///     ...     (0xb4c2, up_py_rs.UPayload.from_string("heading")),
+    ///     ... ])
+    #[pyo3(signature = (messages, priority=None))]
+    fn publish_batch(
+        &self,
+        py: Python,
+        messages: Vec<(u16, Option<UPayload>)>,
+        priority: Option<&str>,
+    ) -> PyResult<()> {
+        let priority = priority.map(parse_priority).transpose()?;
+        let messages = messages
+            .into_iter()
+            .map(|(resource_id, payload)| (resource_id, payload.map(|p| p.inner)))
+            .collect();
+        self.publish_all(py, messages, priority)
+    }
+
+    /// Publish the same payload to several resources in a single call.
+    ///
+    /// The payload is built once and shared by every message; only a
+    /// reference to its buffer is copied per resource.
+    ///
+    /// Args:
+    ///     resource_ids (list[int]): The target resource IDs (0 to 65535), in order.
+    ///     payload (UPayload | None): The payload to publish to each of them.
+    ///     priority (str | None): Optional message priority, using the same names as
+    ///         ``publish``. Applies to every message in the call.
+    ///
+    /// Raises:
+    ///     Exception: If the priority is unknown, or if publishing any of the
+    ///                messages fails. Messages before the failing one have
+    ///                already been sent.
+    ///
+    /// Example:
+    ///     >>> payload = up_py_rs.UPayload.from_string("shutdown")
+    ///     >>> publisher.publish_to_all([0xb4c1, 0xb4c2, 0xb4c3], payload)
+    #[pyo3(signature = (resource_ids, payload, priority=None))]
+    fn publish_to_all(
+        &self,
+        py: Python,
+        resource_ids: Vec<u16>,
+        payload: Option<UPayload>,
+        priority: Option<&str>,
+    ) -> PyResult<()> {
+        let priority = priority.map(parse_priority).transpose()?;
+        let payload = payload.map(|p| p.inner);
+        let messages = resource_ids
+            .into_iter()
+            .map(|resource_id| (resource_id, payload.clone()))
+            .collect();
+        self.publish_all(py, messages, priority)
+    }
 }
 
-#[async_trait::async_trait]
-impl UListener for PythonNotificationListener {
-    async fn on_receive(&self, msg: RustUMessage) {
-        Python::with_gil(|py| {
-            // Import UMessage from local_transport module
-            let py_msg = crate::local_transport::UMessage { inner: msg };
-            if let Err(e) = self.callback.call1(py, (py_msg,)) {
-                eprintln!("Error calling Python notification callback: {:?}", e);
-            }
-        });
+impl SimplePublisher {
+    /// Send `(resource_id, payload)` pairs through one publisher with the GIL released,
+    /// stamping every message with `priority` if one is given.
+    fn publish_all(
+        &self,
+        py: Python,
+        messages: Vec<(u16, Option<RustUPayload>)>,
+        priority: Option<UPriority>,
+    ) -> PyResult<()> {
+        let transport_arc = self.transport.as_transport_arc();
+        let uri_provider = self.uri_provider.clone();
+        let runtime = &self.runtime;
+
+        py.allow_threads(|| {
+            runtime.block_on(async move {
+                let publisher = RustSimplePublisher::new(transport_arc, uri_provider);
+                for (resource_id, payload) in messages {
+                    let call_options = CallOptions::for_publish(None, None, priority);
+                    publisher
+                        .publish(resource_id, call_options, payload)
+                        .await
+                        .map_err(|e| PyException::new_err(format!("Failed to publish: {}", e)))?;
+                }
+                Ok(())
+            })
+        })
     }
 }
 
@@ -213,13 +751,15 @@ impl UListener for PythonNotificationListener {
 ///
 /// SimpleNotifier provides an easy-to-use interface for sending notifications
 /// and listening for notifications from other entities in the uProtocol network.
+///
+/// The GIL is released while notifications are sent and while listeners are
+/// (un)registered with the transport.
 #[pyclass]
 pub struct SimpleNotifier {
     inner: RustSimpleNotifier,
     runtime: tokio::runtime::Runtime,
-    // Store listeners to enable proper unregistration
-    // Key is a string representation of the topic URI
-    listeners: Arc<Mutex<HashMap<String, Arc<PythonNotificationListener>>>>,
+    // Store listeners so that stop_listening hands back the very same instance
+    listeners: Mutex<ListenerRegistry>,
 }
 
 #[pymethods]
@@ -247,17 +787,23 @@ impl SimpleNotifier {
         Ok(SimpleNotifier {
             inner: RustSimpleNotifier::new(transport.inner.clone(), uri_provider.inner.clone()),
             runtime,
-            listeners: Arc::new(Mutex::new(HashMap::new())),
+            listeners: Mutex::new(ListenerRegistry::default()),
         })
     }
 
     /// Start listening for notifications on a specific topic.
     ///
+    /// The listener is in place when this method returns, so notifications sent
+    /// afterwards are delivered to it without any further wait.
+    ///
     /// Args:
     ///     topic (UUri): The topic URI to listen to.
     ///     callback (callable): A Python function that accepts a UMessage parameter.
     ///                         Will be called when notifications arrive.
     ///
+    /// Returns:
+    ///     ListenerHandle: Token to pass to ``stop_listening``.
+    ///
     /// Raises:
     ///     Exception: If listener registration fails.
     ///
@@ -267,76 +813,81 @@ impl SimpleNotifier {
     ///     ...     if text:
     ///     ...         print(f"Notification: {text}")
     ///     >>> topic = uri_provider.get_resource_uri(0xd100)
-    ///     >>> notifier.start_listening(topic, notification_handler)
+    ///     >>> handle = notifier.start_listening(topic, notification_handler)
     fn start_listening(
-        &mut self,
-        _py: Python,
+        &self,
+        py: Python,
         topic: &UUri,
         callback: PyObject,
-    ) -> PyResult<()> {
-        // Create a key for storing the listener
-        let topic_key = format!("{:?}", topic.inner);
-        
-        // Create the listener wrapper
-        let listener = Arc::new(PythonNotificationListener {
-            callback: callback.clone(),
-        });
-        
-        // Store the listener for later retrieval
-        {
-            let mut listeners = self.listeners.lock()
-                .map_err(|e| PyException::new_err(format!("Failed to acquire listener lock: {}", e)))?;
-            listeners.insert(topic_key, listener.clone());
-        }
+    ) -> PyResult<ListenerHandle> {
+        let listener: Arc<dyn UListener> =
+            Arc::new(PythonListener::new(py, callback.clone_ref(py)));
 
-        self.runtime.block_on(async {
-            self.inner
-                .start_listening(&topic.inner, listener)
-                .await
-                .map_err(|e| {
-                    PyException::new_err(format!("Failed to start listening: {}", e))
-                })
-        })
+        let topic_uri = topic.inner.clone();
+        let (inner, runtime) = (&self.inner, &self.runtime);
+        py.allow_threads(|| {
+            runtime.block_on(async {
+                inner
+                    .start_listening(&topic_uri, listener.clone())
+                    .await
+                    .map_err(|e| {
+                        PyException::new_err(format!("Failed to start listening: {}", e))
+                    })
+            })
+        })?;
+
+        Ok(self.lock_listeners()?.insert(topic_uri, listener, Some(callback)))
     }
 
-    /// Stop listening for notifications on a specific topic.
+    /// Stop listening for notifications.
     ///
     /// Args:
-    ///     topic (UUri): The topic URI to stop listening to.
-    ///     callback (callable): The same Python function that was registered.
+    ///     handle (ListenerHandle): The handle returned by ``start_listening``.
     ///
     /// Raises:
-    ///     Exception: If listener unregistration fails.
+    ///     Exception: If the handle is unknown or listener unregistration fails.
     ///
     /// Example:
-    ///     >>> notifier.stop_listening(topic, notification_handler)
+    ///     >>> handle = notifier.start_listening(topic, notification_handler)
+    ///     >>> notifier.stop_listening(handle)
+    ///
+    /// Note:
+    ///     The older form ``stop_listening(topic, callback)`` is still accepted
+    ///     but deprecated; it emits a DeprecationWarning.
+    #[pyo3(signature = (handle, callback=None))]
     fn stop_listening(
-        &mut self,
-        _py: Python,
-        topic: &UUri,
-        callback: PyObject,
+        &self,
+        py: Python,
+        handle: &PyAny,
+        callback: Option<PyObject>,
     ) -> PyResult<()> {
-        // Create the same key used during registration
-        let topic_key = format!("{:?}", topic.inner);
-        
-        // Retrieve the stored listener
-        let listener = {
-            let mut listeners = self.listeners.lock()
-                .map_err(|e| PyException::new_err(format!("Failed to acquire listener lock: {}", e)))?;
-            listeners.remove(&topic_key)
-                .ok_or_else(|| PyException::new_err(
-                    format!("No listener registered for topic: {}", topic_key)
-                ))?
+        let entry = if let Ok(handle) = handle.extract::<ListenerHandle>() {
+            self.lock_listeners()?.get(&handle)?
+        } else {
+            let topic = handle.extract::<PyRef<UUri>>()?;
+            let Some(callback) = callback else {
+                return Err(PyException::new_err(
+                    "callback is required when stopping by topic",
+                ));
+            };
+            warn_unregister_by_callback(py, "SimpleNotifier.stop_listening")?;
+            self.lock_listeners()?.get_by_callback(&topic.inner, &callback)?
         };
 
-        self.runtime.block_on(async {
-            self.inner
-                .stop_listening(&topic.inner, listener)
-                .await
-                .map_err(|e| {
-                    PyException::new_err(format!("Failed to stop listening: {}", e))
-                })
-        })
+        let (inner, runtime) = (&self.inner, &self.runtime);
+        py.allow_threads(|| {
+            runtime.block_on(async {
+                inner
+                    .stop_listening(&entry.uri, entry.listener)
+                    .await
+                    .map_err(|e| {
+                        PyException::new_err(format!("Failed to stop listening: {}", e))
+                    })
+            })
+        })?;
+        // Only forget the registration once the notifier has actually dropped it
+        self.lock_listeners()?.remove(entry.id);
+        Ok(())
     }
 
     /// Send a notification to a specific destination.
@@ -345,29 +896,47 @@ impl SimpleNotifier {
     ///     resource_id (int): The notification resource ID (0 to 65535).
     ///     destination (UUri): The destination URI to send the notification to.
     ///     payload (UPayload | None): The notification payload, or None for empty notifications.
+    ///     priority (str | None): Optional message priority, using the same names as
+    ///         ``SimplePublisher.publish``. Defaults to the transport's default priority.
     ///
     /// Raises:
-    ///     Exception: If notification sending fails.
+    ///     Exception: If the priority is unknown or notification sending fails.
     ///
     /// Example:
     ///     >>> payload = up_py_rs.UPayload.from_string("Alert!")
     ///     >>> destination = uri_provider.get_source_uri()
     ///     >>> notifier.notify(0xd100, destination, payload)
+    ///     >>> notifier.notify(0xd100, destination, payload, priority="RealTime")
+    #[pyo3(signature = (resource_id, destination, payload, priority=None))]
     fn notify(
-        &mut self,
-        _py: Python,
+        &self,
+        py: Python,
         resource_id: u16,
         destination: &UUri,
         payload: Option<UPayload>,
+        priority: Option<&str>,
     ) -> PyResult<()> {
+        let priority = priority.map(parse_priority).transpose()?;
         let payload_inner = payload.map(|p| p.inner);
-        let call_options = CallOptions::for_notification(None, None, None);
+        let call_options = CallOptions::for_notification(None, None, priority);
+        let destination_uri = destination.inner.clone();
+        let (inner, runtime) = (&self.inner, &self.runtime);
 
-        self.runtime.block_on(async {
-            self.inner
-                .notify(resource_id, &destination.inner, call_options, payload_inner)
-                .await
-                .map_err(|e| PyException::new_err(format!("Failed to send notification: {}", e)))
+        py.allow_threads(|| {
+            runtime.block_on(async {
+                inner
+                    .notify(resource_id, &destination_uri, call_options, payload_inner)
+                    .await
+                    .map_err(|e| PyException::new_err(format!("Failed to send notification: {}", e)))
+            })
         })
     }
 }
+
+impl SimpleNotifier {
+    fn lock_listeners(&self) -> PyResult<std::sync::MutexGuard<'_, ListenerRegistry>> {
+        self.listeners
+            .lock()
+            .map_err(|e| PyException::new_err(format!("Failed to acquire listener lock: {}", e)))
+    }
+}
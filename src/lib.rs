@@ -13,8 +13,19 @@ use std::sync::Arc;
 
 use protobuf::well_known_types::wrappers::StringValue;
 
-use communication::{SimplePublisher, SimpleNotifier, UPayload};
-use local_transport::{LocalTransport, StaticUriProvider, UMessage};
+use communication::{SimplePublisher, SimpleNotifier, UPayload, UPayloadBuilder};
+use local_transport::{ListenerHandle, LocalTransport, StaticUriProvider, StringListener, UMessage};
+
+/// Attach `sub` to `parent` and register it in `sys.modules` under its dotted name.
+///
+/// The registration lets the Python shims import classes straight from the native
+/// submodule (``from .up_py_rs.communication import ...``) instead of rebinding them
+/// one by one through an intermediate module reference.
+fn add_submodule(py: Python, parent: &PyModule, sub: &PyModule) -> PyResult<()> {
+    parent.add_submodule(sub)?;
+    let name = format!("{}.{}", parent.name()?, sub.name()?);
+    py.import("sys")?.getattr("modules")?.set_item(name, sub)
+}
 
 #[pymodule]
 fn up_py_rs(py: Python, m: &PyModule) -> PyResult<()> {
@@ -26,16 +37,19 @@ fn up_py_rs(py: Python, m: &PyModule) -> PyResult<()> {
     communication_mod.add_class::<SimplePublisher>()?;
     communication_mod.add_class::<SimpleNotifier>()?;
     communication_mod.add_class::<UPayload>()?;
-    m.add_submodule(communication_mod)?;
+    communication_mod.add_class::<UPayloadBuilder>()?;
+    add_submodule(py, m, communication_mod)?;
 
     // local transport submodule
     let local_transport_mod = PyModule::new(py, "local_transport")?;
     local_transport_mod.add_class::<LocalTransport>()?;
-    m.add_submodule(local_transport_mod)?;
+    add_submodule(py, m, local_transport_mod)?;
 
     // Add top-level classes
     m.add_class::<UMessage>()?;
     m.add_class::<StaticUriProvider>()?;
+    m.add_class::<StringListener>()?;
+    m.add_class::<ListenerHandle>()?;
 
     // Conditionally add zenoh transport submodule
     #[cfg(feature = "zenoh")]
@@ -43,7 +57,7 @@ fn up_py_rs(py: Python, m: &PyModule) -> PyResult<()> {
         let zenoh_mod = PyModule::new(py, "zenoh_transport")?;
         zenoh_mod.add_class::<zenoh_transport::UPTransportZenoh>()?;
         zenoh_mod.add_class::<zenoh_transport::UPTransportZenohBuilder>()?;
-        m.add_submodule(zenoh_mod)?;
+        add_submodule(py, m, zenoh_mod)?;
     }
 
     Ok(())
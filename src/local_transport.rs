@@ -9,18 +9,56 @@ use up_rust::{
 };
 
 use protobuf::well_known_types::wrappers::StringValue;
-use pyo3::exceptions::PyException;
+use pyo3::exceptions::{PyDeprecationWarning, PyException};
 use pyo3::prelude::*;
-use std::sync::Arc;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBytes, PyString};
+use std::collections::HashMap;
+use std::ffi::c_void;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Mutex};
 
 /// Internal struct to bridge Python callbacks to Rust UListener trait
-struct PythonListener {
+///
+/// Shared by every transport and by SimpleNotifier. When the callback is a
+/// StringListener, the payload is decoded here and the wrapped function is
+/// called with the string directly.
+pub(crate) struct PythonListener {
     callback: PyObject,
+    text_only: bool,
+}
+
+impl PythonListener {
+    pub(crate) fn new(py: Python, callback: PyObject) -> Self {
+        match callback.extract::<PyRef<StringListener>>(py) {
+            Ok(string_listener) => Self {
+                callback: string_listener.callback.clone_ref(py),
+                text_only: true,
+            },
+            Err(_) => Self {
+                callback,
+                text_only: false,
+            },
+        }
+    }
 }
 
 #[async_trait::async_trait]
 impl UListener for PythonListener {
     async fn on_receive(&self, msg: RustUMessage) {
+        if self.text_only {
+            // Decode before taking the GIL, and skip non-string payloads entirely
+            let Some(text) = extract_text(&msg) else {
+                return;
+            };
+            Python::with_gil(|py| {
+                if let Err(e) = self.callback.call1(py, (text,)) {
+                    eprintln!("Error calling Python callback: {:?}", e);
+                }
+            });
+            return;
+        }
+
         Python::with_gil(|py| {
             let py_msg = UMessage { inner: msg };
             if let Err(e) = self.callback.call1(py, (py_msg,)) {
@@ -30,6 +68,193 @@ impl UListener for PythonListener {
     }
 }
 
+/// Signature of native listener callbacks: payload pointer, payload length, user data.
+type NativeCallback = unsafe extern "C" fn(*const u8, usize, *mut c_void);
+
+/// Internal struct to bridge native (C ABI) callbacks to Rust UListener trait
+///
+/// The function is called directly on the delivering thread without taking
+/// the GIL. The payload pointer is only valid for the duration of the call.
+pub(crate) struct NativeListener {
+    callback: NativeCallback,
+    user_data: usize,
+}
+
+impl NativeListener {
+    pub(crate) fn new(fn_ptr: usize, user_data: usize) -> PyResult<Self> {
+        if fn_ptr == 0 {
+            return Err(PyException::new_err("Callback function pointer must not be null"));
+        }
+        // SAFETY: the caller guarantees that fn_ptr is the address of a function
+        // with the NativeCallback signature that outlives the registration.
+        let callback = unsafe { std::mem::transmute::<usize, NativeCallback>(fn_ptr) };
+        Ok(Self { callback, user_data })
+    }
+}
+
+#[async_trait::async_trait]
+impl UListener for NativeListener {
+    async fn on_receive(&self, msg: RustUMessage) {
+        let payload = msg.payload.as_deref().unwrap_or(&[]);
+        // SAFETY: see NativeListener::new
+        unsafe {
+            (self.callback)(payload.as_ptr(), payload.len(), self.user_data as *mut c_void);
+        }
+    }
+}
+
+/// Opaque token identifying one listener registration.
+///
+/// Returned by ``register_listener``, ``register_listener_c`` and
+/// ``SimpleNotifier.start_listening``, and passed back to the matching
+/// unregister method to remove exactly that registration. Handles are unique
+/// within the process; passing one to a different transport or notifier raises.
+///
+/// Example:
+///     >>> handle = transport.register_listener(uri_provider, 0xb4c1, my_handler)
+///     >>> transport.unregister_listener(handle)
+#[pyclass(frozen)]
+#[derive(Clone)]
+pub struct ListenerHandle {
+    pub(crate) id: u64,
+}
+
+#[pymethods]
+impl ListenerHandle {
+    fn __repr__(&self) -> String {
+        format!("ListenerHandle({})", self.id)
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.id == other.id
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.id
+    }
+}
+
+/// Source of listener handle ids. A single process-wide counter keeps ids unique
+/// across transports and notifiers, so a handle never matches a registration
+/// made through a different object.
+static NEXT_LISTENER_ID: AtomicU64 = AtomicU64::new(1);
+
+/// A listener as it was handed to the transport, kept so that the very same
+/// instance can be passed back on unregistration.
+struct RegisteredListener {
+    uri: RustUUri,
+    listener: Arc<dyn UListener>,
+    // Only set for Python callbacks, for the deprecated unregister-by-callback path
+    callback: Option<PyObject>,
+}
+
+/// A registration looked up for unregistering. The registry keeps the entry
+/// until `ListenerRegistry::remove` is called with `id`.
+pub(crate) struct ListenerEntry {
+    pub(crate) id: u64,
+    pub(crate) uri: RustUUri,
+    pub(crate) listener: Arc<dyn UListener>,
+}
+
+/// Listeners registered through one transport or notifier, indexed by handle id.
+#[derive(Default)]
+pub(crate) struct ListenerRegistry {
+    entries: HashMap<u64, RegisteredListener>,
+}
+
+impl ListenerRegistry {
+    pub(crate) fn insert(
+        &mut self,
+        uri: RustUUri,
+        listener: Arc<dyn UListener>,
+        callback: Option<PyObject>,
+    ) -> ListenerHandle {
+        let id = NEXT_LISTENER_ID.fetch_add(1, Ordering::Relaxed);
+        self.entries.insert(
+            id,
+            RegisteredListener {
+                uri,
+                listener,
+                callback,
+            },
+        );
+        ListenerHandle { id }
+    }
+
+    /// Look up the registration behind `handle`.
+    pub(crate) fn get(&self, handle: &ListenerHandle) -> PyResult<ListenerEntry> {
+        self.entries
+            .get(&handle.id)
+            .map(|entry| ListenerEntry {
+                id: handle.id,
+                uri: entry.uri.clone(),
+                listener: entry.listener.clone(),
+            })
+            .ok_or_else(|| {
+                PyException::new_err(format!("No listener registered for handle {}", handle.id))
+            })
+    }
+
+    /// Look up the registration of `callback` on `uri` by scanning all entries.
+    pub(crate) fn get_by_callback(
+        &self,
+        uri: &RustUUri,
+        callback: &PyObject,
+    ) -> PyResult<ListenerEntry> {
+        self.entries
+            .iter()
+            .find(|(_, entry)| {
+                &entry.uri == uri
+                    && entry
+                        .callback
+                        .as_ref()
+                        .map_or(false, |registered| registered.is(callback))
+            })
+            .map(|(id, entry)| ListenerEntry {
+                id: *id,
+                uri: entry.uri.clone(),
+                listener: entry.listener.clone(),
+            })
+            .ok_or_else(|| PyException::new_err("No listener registered for this callback"))
+    }
+
+    /// Forget a registration once the transport has dropped it.
+    pub(crate) fn remove(&mut self, id: u64) {
+        self.entries.remove(&id);
+    }
+}
+
+/// Emit the DeprecationWarning for unregistering by callback instead of handle.
+pub(crate) fn warn_unregister_by_callback(py: Python, method: &str) -> PyResult<()> {
+    let message = format!(
+        "Passing the callback to {} is deprecated; pass the ListenerHandle returned at registration instead",
+        method
+    );
+    PyErr::warn(py, py.get_type::<PyDeprecationWarning>(), &message, 1)
+}
+
+/// Borrow the payload of a UPAYLOAD_FORMAT_TEXT message as a string.
+///
+/// Such payloads are plain UTF-8, so no protobuf decoding is needed. The bytes
+/// are still validated because they may come from any peer on the transport.
+fn text_payload(msg: &RustUMessage) -> Option<&str> {
+    let format = msg.attributes.as_ref()?.payload_format.enum_value_or_default();
+    if format != UPayloadFormat::UPAYLOAD_FORMAT_TEXT {
+        return None;
+    }
+    std::str::from_utf8(msg.payload.as_deref()?).ok()
+}
+
+/// Decode the string value carried in a message payload, if any.
+fn extract_text(msg: &RustUMessage) -> Option<String> {
+    if let Some(text) = text_payload(msg) {
+        return Some(text.to_owned());
+    }
+    msg.extract_protobuf::<StringValue>()
+        .ok()
+        .map(|value| value.value)
+}
+
 /// Represents a complete uProtocol message.
 ///
 /// UMessage encapsulates both the payload and metadata for a uProtocol communication.
@@ -44,6 +269,10 @@ pub struct UMessage {
 impl UMessage {
     /// Extract string value from the message payload.
     ///
+    /// Both payloads created with ``UPayload.from_string`` and plain text
+    /// payloads created with ``UPayload.from_text`` are supported. Text payloads
+    /// are turned into a ``str`` straight from the payload bytes.
+    ///
     /// Returns:
     ///     str | None: The extracted string if successful, None if the message
     ///                 doesn't contain a string value.
@@ -52,19 +281,107 @@ impl UMessage {
     ///     >>> text = message.extract_string()
     ///     >>> if text:
     ///     ...     print(f"Received: {text}")
-    fn extract_string(&self) -> PyResult<Option<String>> {
-        match self.inner.extract_protobuf::<StringValue>() {
-            Ok(value) => Ok(Some(value.value)),
-            Err(_) => Ok(None),
+    fn extract_string(&self, py: Python) -> Option<Py<PyString>> {
+        match text_payload(&self.inner) {
+            Some(text) => Some(PyString::new(py, text).into()),
+            None => extract_text(&self.inner).map(|text| PyString::new(py, &text).into()),
         }
     }
+
+    /// Extract the raw payload bytes of the message.
+    ///
+    /// Returns:
+    ///     bytes | None: The payload exactly as carried on the wire, or None if
+    ///                   the message has no payload.
+    ///
+    /// Example:
+    ///     >>> data = message.extract_bytes()
+    ///     >>> if data is not None:
+    ///     ...     print(f"Received {len(data)} bytes")
+    fn extract_bytes<'py>(&self, py: Python<'py>) -> Option<&'py PyBytes> {
+        self.inner
+            .payload
+            .as_deref()
+            .map(|payload| PyBytes::new(py, payload))
+    }
+}
+
+/// Wraps a callback that only needs the text of each message.
+///
+/// Pass a StringListener anywhere a listener callback is accepted. The
+/// extension then decodes string payloads itself and calls the wrapped
+/// function with a `str`, skipping the UMessage object and the
+/// `extract_string()` call on every delivery. Messages that don't carry a
+/// string payload are not delivered.
+#[pyclass]
+pub struct StringListener {
+    callback: PyObject,
+}
+
+#[pymethods]
+impl StringListener {
+    /// Create a new StringListener.
+    ///
+    /// Args:
+    ///     callback (callable): A Python function that accepts a str parameter.
+    ///
+    /// Returns:
+    ///     StringListener: A listener that can be registered with any transport.
+    ///
+    /// Example:
+    ///     >>> listener = up_py_rs.StringListener(lambda text: print(text))
+    ///     >>> transport.register_listener(uri_provider, 0xb4c1, listener)
+    #[new]
+    fn new(callback: PyObject) -> Self {
+        StringListener { callback }
+    }
+
+    /// Deliver a message by hand, as the extension does for registered listeners.
+    fn __call__(&self, py: Python, msg: PyRef<UMessage>) -> PyResult<()> {
+        if let Some(text) = extract_text(&msg.inner) {
+            self.callback.call1(py, (text,))?;
+        }
+        Ok(())
+    }
 }
 
 /// UUri class
+///
+/// `str()` of a UUri is formatted once and the resulting Python string is
+/// kept, so converting the same topic repeatedly does not reformat it.
 #[pyclass]
-#[derive(Clone)]
 pub struct UUri {
     pub inner: RustUUri,
+    text: GILOnceCell<Py<PyString>>,
+}
+
+impl UUri {
+    pub(crate) fn new(inner: RustUUri) -> Self {
+        UUri {
+            inner,
+            text: GILOnceCell::new(),
+        }
+    }
+}
+
+impl Clone for UUri {
+    fn clone(&self) -> Self {
+        UUri::new(self.inner.clone())
+    }
+}
+
+#[pymethods]
+impl UUri {
+    /// Return the URI in its string form, e.g. ``//my-vehicle/A34B/1/D100``.
+    fn __str__(&self, py: Python) -> Py<PyString> {
+        self.text
+            .get_or_init(py, || PyString::new(py, &self.inner.to_uri(false)).into())
+            .clone_ref(py)
+    }
+
+    fn __repr__(&self, py: Python) -> String {
+        format!("UUri('{}')", self.__str__(py).as_ref(py).to_string_lossy())
+    }
 }
 
 /// Provides URI information for uProtocol entities.
@@ -72,9 +389,16 @@ pub struct UUri {
 /// StaticUriProvider creates and manages URIs for identifying entities
 /// in the uProtocol network. It combines an authority (device/vehicle name),
 /// entity ID, and version to create unique identifiers.
+///
+/// The provider is static, so the URIs it hands out never change. They are
+/// created once per resource ID and the same UUri object is returned on
+/// subsequent calls.
 #[pyclass]
 pub struct StaticUriProvider {
     pub inner: Arc<RustStaticUriProvider>,
+    source_uri: Py<UUri>,
+    // Resource URIs already handed out, keyed by resource ID
+    resource_uris: Mutex<HashMap<u16, Py<UUri>>>,
 }
 
 #[pymethods]
@@ -93,15 +417,40 @@ impl StaticUriProvider {
     /// Example:
     ///     >>> provider = up_py_rs.StaticUriProvider("my-vehicle", 0xa34b, 0x01)
     #[new]
-    fn new(authority: String, entity_id: u32, version: u8) -> Self {
-        StaticUriProvider {
-            inner: Arc::new(RustStaticUriProvider::new(&authority, entity_id, version)),
-        }
+    fn new(py: Python, authority: String, entity_id: u32, version: u8) -> PyResult<Self> {
+        let inner = Arc::new(RustStaticUriProvider::new(&authority, entity_id, version));
+        let source_uri = Py::new(py, UUri::new(inner.get_source_uri()))?;
+        Ok(StaticUriProvider {
+            inner,
+            source_uri,
+            resource_uris: Mutex::new(HashMap::new()),
+        })
     }
 
-    fn get_resource_uri(&self, _py: Python, resource_id: u16) -> UUri {
-        let uuri = self.inner.get_resource_uri(resource_id);
-        UUri { inner: uuri }
+    /// Get a resource URI for a specific resource ID.
+    ///
+    /// Args:
+    ///     resource_id (int): The resource ID (0 to 65535).
+    ///
+    /// Returns:
+    ///     UUri: The resource URI. Repeated calls with the same resource ID
+    ///           return the same object.
+    ///
+    /// Raises:
+    ///     Exception: If the URI cache lock cannot be acquired.
+    ///
+    /// Example:
+    ///     >>> provider = up_py_rs.StaticUriProvider("my-vehicle", 0xa34b, 0x01)
+    ///     >>> topic = provider.get_resource_uri(0xd100)
+    fn get_resource_uri(&self, py: Python, resource_id: u16) -> PyResult<Py<UUri>> {
+        let mut resource_uris = self.resource_uris.lock()
+            .map_err(|e| PyException::new_err(format!("Failed to acquire URI cache lock: {}", e)))?;
+        if let Some(uuri) = resource_uris.get(&resource_id) {
+            return Ok(uuri.clone_ref(py));
+        }
+        let uuri = Py::new(py, UUri::new(self.inner.get_resource_uri(resource_id)))?;
+        resource_uris.insert(resource_id, uuri.clone_ref(py));
+        Ok(uuri)
     }
 
     /// Get the source URI for this entity.
@@ -112,9 +461,8 @@ impl StaticUriProvider {
     /// Example:
     ///     >>> provider = up_py_rs.StaticUriProvider("my-vehicle", 0xa34b, 0x01)
     ///     >>> source_uri = provider.get_source_uri()
-    fn get_source_uri(&self, _py: Python) -> UUri {
-        let uuri = self.inner.get_source_uri();
-        UUri { inner: uuri }
+    fn get_source_uri(&self, py: Python) -> Py<UUri> {
+        self.source_uri.clone_ref(py)
     }
 }
 
@@ -125,10 +473,16 @@ impl StaticUriProvider {
 /// LocalTransport enables communication between components within the same
 /// process without network overhead. It manages listener registration and
 /// message routing.
+///
+/// When several listeners match a message, they all share one payload buffer;
+/// handing the message to each listener only bumps a reference count. Nothing
+/// is copied until a listener asks for the payload: each ``extract_bytes()``
+/// or ``extract_string()`` call then makes its own copy.
 #[pyclass]
 pub struct LocalTransport {
     pub inner: Arc<RustLocalTransport>,
     runtime: tokio::runtime::Runtime,
+    listeners: Mutex<ListenerRegistry>,
 }
 
 #[pymethods]
@@ -150,74 +504,165 @@ impl LocalTransport {
         Ok(LocalTransport {
             inner: Arc::new(RustLocalTransport::default()),
             runtime,
+            listeners: Mutex::new(ListenerRegistry::default()),
         })
     }
 
     /// Register a listener callback for a specific resource.
     ///
+    /// The listener is in place when this method returns, so messages published
+    /// afterwards are delivered to it without any further wait.
+    ///
     /// Args:
     ///     uri_provider (StaticUriProvider): The URI provider identifying the entity.
     ///     resource_id (int): The resource ID to listen to (0 to 65535).
     ///     callback (callable): A Python function that accepts a UMessage parameter.
     ///                         Will be called when messages arrive.
     ///
+    /// Returns:
+    ///     ListenerHandle: Token to pass to ``unregister_listener``.
+    ///
     /// Raises:
     ///     Exception: If registration fails.
     ///
     /// Example:
     ///     >>> def my_handler(msg: UMessage):
     ///     ...     print(msg.extract_string())
-    ///     >>> transport.register_listener(uri_provider, 0xb4c1, my_handler)
+    ///     >>> handle = transport.register_listener(uri_provider, 0xb4c1, my_handler)
     fn register_listener(
-        &mut self,
-        _py: Python,
+        &self,
+        py: Python,
         uri_provider: &StaticUriProvider,
         resource_id: u16,
         callback: PyObject,
-    ) -> PyResult<()> {
-        let listener = Arc::new(PythonListener {
-            callback: callback.clone(),
-        });
+    ) -> PyResult<ListenerHandle> {
+        let listener: Arc<dyn UListener> =
+            Arc::new(PythonListener::new(py, callback.clone_ref(py)));
         let uri = uri_provider.inner.get_resource_uri(resource_id);
+        self.register(py, uri, listener, Some(callback))
+    }
 
-        self.runtime.block_on(async {
-            self.inner
-                .register_listener(&uri, None, listener)
-                .await
-                .map_err(|e| PyException::new_err(format!("Failed to register listener: {}", e)))
-        })
+    /// Register a native (C ABI) callback for a specific resource.
+    ///
+    /// The callback is invoked directly from the delivering thread without
+    /// acquiring the GIL, so no Python code runs per message unless the
+    /// callback itself calls back into Python.
+    ///
+    /// Only the raw address is stored. The function, and whatever ``user_data``
+    /// points to, must stay valid until ``unregister_listener`` returns. For a
+    /// ``ctypes.CFUNCTYPE`` callback, keep a reference to the CFUNCTYPE object
+    /// until then: once it is garbage collected the stored pointer dangles and
+    /// the next message calls freed memory.
+    ///
+    /// Args:
+    ///     uri_provider (StaticUriProvider): The URI provider identifying the entity.
+    ///     resource_id (int): The resource ID to listen to (0 to 65535).
+    ///     fn_ptr (int): Address of a function with the C signature
+    ///                   ``void callback(const uint8_t *payload, size_t len, void *user_data)``.
+    ///                   The payload pointer is only valid during the call.
+    ///     user_data (int): Opaque pointer passed back to the callback (default 0).
+    ///
+    /// Returns:
+    ///     ListenerHandle: Token to pass to ``unregister_listener``.
+    ///
+    /// Raises:
+    ///     Exception: If fn_ptr is null or registration fails.
+    ///
+    /// Example:
+    ///     >>> lib = ctypes.CDLL("./libhandlers.so")
+    ///     >>> fn_ptr = ctypes.cast(lib.on_payload, ctypes.c_void_p).value
+    ///     >>> handle = transport.register_listener_c(uri_provider, 0xb4c1, fn_ptr)
+    ///     >>> transport.unregister_listener(handle)
+    #[pyo3(signature = (uri_provider, resource_id, fn_ptr, user_data=0))]
+    fn register_listener_c(
+        &self,
+        py: Python,
+        uri_provider: &StaticUriProvider,
+        resource_id: u16,
+        fn_ptr: usize,
+        user_data: usize,
+    ) -> PyResult<ListenerHandle> {
+        let listener: Arc<dyn UListener> = Arc::new(NativeListener::new(fn_ptr, user_data)?);
+        let uri = uri_provider.inner.get_resource_uri(resource_id);
+        self.register(py, uri, listener, None)
     }
 
     /// Unregister a previously registered listener.
     ///
     /// Args:
-    ///     uri_provider (StaticUriProvider): The URI provider used during registration.
-    ///     resource_id (int): The resource ID to stop listening to.
-    ///     callback (callable): The same Python function that was registered.
+    ///     handle (ListenerHandle): The handle returned by ``register_listener``
+    ///                              or ``register_listener_c``.
     ///
     /// Raises:
-    ///     Exception: If unregistration fails or listener not found.
+    ///     Exception: If the handle is unknown or unregistration fails.
+    ///
+    /// Example:
+    ///     >>> handle = transport.register_listener(uri_provider, 0xb4c1, my_handler)
+    ///     >>> transport.unregister_listener(handle)
     ///
     /// Note:
-    ///     Currently may fail due to listener instance comparison issues.
-    ///     Consider letting listeners be cleaned up automatically.
+    ///     The older form ``unregister_listener(uri_provider, resource_id, callback)``
+    ///     is still accepted but deprecated; it emits a DeprecationWarning.
+    #[pyo3(signature = (handle, resource_id=None, callback=None))]
     fn unregister_listener(
-        &mut self,
-        _py: Python,
-        uri_provider: &StaticUriProvider,
-        resource_id: u16,
-        callback: PyObject,
+        &self,
+        py: Python,
+        handle: &PyAny,
+        resource_id: Option<u16>,
+        callback: Option<PyObject>,
     ) -> PyResult<()> {
-        let listener = Arc::new(PythonListener {
-            callback: callback.clone(),
-        });
-        let uri = uri_provider.inner.get_resource_uri(resource_id);
+        let entry = if let Ok(handle) = handle.extract::<ListenerHandle>() {
+            self.lock_listeners()?.get(&handle)?
+        } else {
+            let uri_provider = handle.extract::<PyRef<StaticUriProvider>>()?;
+            let (Some(resource_id), Some(callback)) = (resource_id, callback) else {
+                return Err(PyException::new_err(
+                    "resource_id and callback are required when unregistering by URI provider",
+                ));
+            };
+            warn_unregister_by_callback(py, "LocalTransport.unregister_listener")?;
+            let uri = uri_provider.inner.get_resource_uri(resource_id);
+            self.lock_listeners()?.get_by_callback(&uri, &callback)?
+        };
 
-        self.runtime.block_on(async {
-            self.inner
-                .unregister_listener(&uri, None, listener)
-                .await
-                .map_err(|e| PyException::new_err(format!("Failed to unregister listener: {}", e)))
-        })
+        let (inner, runtime) = (&self.inner, &self.runtime);
+        py.allow_threads(|| {
+            runtime.block_on(async {
+                inner
+                    .unregister_listener(&entry.uri, None, entry.listener)
+                    .await
+                    .map_err(|e| PyException::new_err(format!("Failed to unregister listener: {}", e)))
+            })
+        })?;
+        // Only forget the registration once the transport has actually dropped it
+        self.lock_listeners()?.remove(entry.id);
+        Ok(())
+    }
+}
+
+impl LocalTransport {
+    fn lock_listeners(&self) -> PyResult<std::sync::MutexGuard<'_, ListenerRegistry>> {
+        self.listeners
+            .lock()
+            .map_err(|e| PyException::new_err(format!("Failed to acquire listener lock: {}", e)))
+    }
+
+    fn register(
+        &self,
+        py: Python,
+        uri: RustUUri,
+        listener: Arc<dyn UListener>,
+        callback: Option<PyObject>,
+    ) -> PyResult<ListenerHandle> {
+        let (inner, runtime) = (&self.inner, &self.runtime);
+        py.allow_threads(|| {
+            runtime.block_on(async {
+                inner
+                    .register_listener(&uri, None, listener.clone())
+                    .await
+                    .map_err(|e| PyException::new_err(format!("Failed to register listener: {}", e)))
+            })
+        })?;
+        Ok(self.lock_listeners()?.insert(uri, listener, callback))
     }
 }
@@ -5,11 +5,15 @@
 
 use pyo3::prelude::*;
 use pyo3::exceptions::PyException;
-use std::sync::Arc;
+use std::sync::{Arc, Mutex, MutexGuard};
 use tokio::runtime::Runtime;
-use up_rust::{UListener, UMessage, UStatus, UTransport, UUri};
+use up_rust::{UListener, UTransport, UUri as RustUUri};
 use up_transport_zenoh::{zenoh_config, UPTransportZenoh as RustUPTransportZenoh};
 
+use crate::local_transport::{
+    warn_unregister_by_callback, ListenerHandle, ListenerRegistry, NativeListener, PythonListener,
+};
+
 /// Python wrapper for the Rust UPTransportZenoh
 ///
 /// Provides network transport capabilities using the Zenoh protocol.
@@ -19,6 +23,7 @@ use up_transport_zenoh::{zenoh_config, UPTransportZenoh as RustUPTransportZenoh}
 pub struct UPTransportZenoh {
     pub(crate) transport: Arc<RustUPTransportZenoh>,
     runtime: Runtime,
+    listeners: Mutex<ListenerRegistry>,
 }
 
 #[pymethods]
@@ -40,6 +45,10 @@ impl UPTransportZenoh {
     fn builder(authority: &str) -> PyResult<UPTransportZenohBuilder> {
         Ok(UPTransportZenohBuilder {
             authority: authority.to_string(),
+            batching: true,
+            mode: None,
+            listen: Vec::new(),
+            connect: Vec::new(),
             runtime: Runtime::new()
                 .map_err(|e| PyException::new_err(format!("Failed to create runtime: {e}")))?,
         })
@@ -60,23 +69,29 @@ impl UPTransportZenoh {
     ///     ```python
     ///     transport.send(message)
     ///     ```
-    fn send(&self, message: crate::local_transport::UMessage) -> PyResult<()> {
+    fn send(&self, py: Python, message: crate::local_transport::UMessage) -> PyResult<()> {
         let rust_message = message.inner.clone();
         let transport = self.transport.clone();
         
-        self.runtime
-            .block_on(async move { transport.as_ref().send(rust_message).await })
-            .map_err(|e| PyException::new_err(format!("Failed to send message: {e}")))
+        let runtime = &self.runtime;
+        py.allow_threads(|| {
+            runtime.block_on(async move { transport.as_ref().send(rust_message).await })
+        })
+        .map_err(|e| PyException::new_err(format!("Failed to send message: {e}")))
     }
 
     /// Register a listener for messages matching the source filter
     ///
+    /// Returns once the Zenoh subscriber has been declared in this session.
+    /// Publishers in other sessions learn about it asynchronously, so messages
+    /// they send right after this returns may still be missed.
+    ///
     /// Args:
     ///     source_filter: The URI to listen for messages from
     ///     listener: Python callable that receives UMessage objects
     ///
     /// Returns:
-    ///     None
+    ///     ListenerHandle: Token to pass to `unregister_listener`
     ///
     /// Raises:
     ///     Exception: If registration fails
@@ -86,64 +101,151 @@ impl UPTransportZenoh {
     ///     def handle_message(msg):
     ///         print(f"Received: {msg.extract_string()}")
     ///     
-    ///     transport.register_listener(source_uri, handle_message)
+    ///     handle = transport.register_listener(source_uri, handle_message)
     ///     ```
     fn register_listener(
         &self,
+        py: Python,
         source_filter: crate::local_transport::UUri,
         listener: PyObject,
-    ) -> PyResult<()> {
-        let rust_listener = Arc::new(PythonListener::new(listener));
-        let transport = self.transport.clone();
-        let rust_uri = source_filter.inner.clone();
+    ) -> PyResult<ListenerHandle> {
+        let rust_listener: Arc<dyn UListener> =
+            Arc::new(PythonListener::new(py, listener.clone_ref(py)));
+        self.register(py, source_filter.inner, rust_listener, Some(listener))
+    }
 
-        self.runtime
-            .block_on(async move {
-                transport
-                    .as_ref()
-                    .register_listener(&rust_uri, None, rust_listener)
-                    .await
-            })
-            .map_err(|e| PyException::new_err(format!("Failed to register listener: {e}")))
+    /// Register a native (C ABI) callback for messages matching the source filter
+    ///
+    /// The callback is invoked directly from the Zenoh receive thread without
+    /// acquiring the GIL, so no Python code runs per message unless the
+    /// callback itself calls back into Python.
+    ///
+    /// Only the raw address is stored. The function, and whatever `user_data`
+    /// points to, must stay valid until `unregister_listener` returns. For a
+    /// `ctypes.CFUNCTYPE` callback, keep a reference to the CFUNCTYPE object
+    /// until then: once it is garbage collected the stored pointer dangles and
+    /// the next message calls freed memory.
+    ///
+    /// Args:
+    ///     source_filter: The URI to listen for messages from
+    ///     fn_ptr: Address of a function with the C signature
+    ///             `void callback(const uint8_t *payload, size_t len, void *user_data)`.
+    ///             The payload pointer is only valid during the call.
+    ///     user_data: Opaque pointer passed back to the callback (default 0)
+    ///
+    /// Returns:
+    ///     ListenerHandle: Token to pass to `unregister_listener`
+    ///
+    /// Raises:
+    ///     Exception: If fn_ptr is null or registration fails
+    ///
+    /// Example:
+    ///     ```python
+    ///     lib = ctypes.CDLL("./libhandlers.so")
+    ///     fn_ptr = ctypes.cast(lib.on_payload, ctypes.c_void_p).value
+    ///     handle = transport.register_listener_c(source_uri, fn_ptr)
+    ///     transport.unregister_listener(handle)
+    ///     ```
+    #[pyo3(signature = (source_filter, fn_ptr, user_data=0))]
+    fn register_listener_c(
+        &self,
+        py: Python,
+        source_filter: crate::local_transport::UUri,
+        fn_ptr: usize,
+        user_data: usize,
+    ) -> PyResult<ListenerHandle> {
+        let rust_listener: Arc<dyn UListener> = Arc::new(NativeListener::new(fn_ptr, user_data)?);
+        self.register(py, source_filter.inner, rust_listener, None)
     }
 
-    /// Unregister a listener for the given source filter
+    /// Unregister a previously registered listener
     ///
     /// Args:
-    ///     source_filter: The URI to stop listening to
-    ///     listener: The Python callable that was registered
+    ///     handle: The ListenerHandle returned by `register_listener` or
+    ///             `register_listener_c`
     ///
     /// Returns:
     ///     None
     ///
     /// Raises:
-    ///     Exception: If unregistration fails
+    ///     Exception: If the handle is unknown or unregistration fails
     ///
     /// Note:
-    ///     Due to listener instance comparison issues, this may not work as expected.
-    ///     Consider letting listeners be cleaned up automatically.
+    ///     The older form `unregister_listener(source_filter, listener)` is still
+    ///     accepted but deprecated; it emits a DeprecationWarning.
     ///
     /// Example:
     ///     ```python
-    ///     transport.unregister_listener(source_uri, handle_message)
+    ///     transport.unregister_listener(handle)
     ///     ```
+    #[pyo3(signature = (handle, listener=None))]
     fn unregister_listener(
         &self,
-        source_filter: crate::local_transport::UUri,
-        listener: PyObject,
+        py: Python,
+        handle: &PyAny,
+        listener: Option<PyObject>,
     ) -> PyResult<()> {
-        let rust_listener = Arc::new(PythonListener::new(listener));
+        let entry = if let Ok(handle) = handle.extract::<ListenerHandle>() {
+            self.lock_listeners()?.get(&handle)?
+        } else {
+            let source_filter = handle.extract::<crate::local_transport::UUri>()?;
+            let Some(listener) = listener else {
+                return Err(PyException::new_err(
+                    "listener is required when unregistering by source filter",
+                ));
+            };
+            warn_unregister_by_callback(py, "UPTransportZenoh.unregister_listener")?;
+            self.lock_listeners()?
+                .get_by_callback(&source_filter.inner, &listener)?
+        };
+
+        let transport = self.transport.clone();
+        let runtime = &self.runtime;
+        let (uri, registered) = (entry.uri, entry.listener);
+        py.allow_threads(|| {
+            runtime.block_on(async move {
+                transport
+                    .as_ref()
+                    .unregister_listener(&uri, None, registered)
+                    .await
+            })
+        })
+            .map_err(|e| PyException::new_err(format!("Failed to unregister listener: {e}")))?;
+        // Only forget the registration once the transport has actually dropped it
+        self.lock_listeners()?.remove(entry.id);
+        Ok(())
+    }
+}
+
+impl UPTransportZenoh {
+    fn lock_listeners(&self) -> PyResult<MutexGuard<'_, ListenerRegistry>> {
+        self.listeners
+            .lock()
+            .map_err(|e| PyException::new_err(format!("Failed to acquire listener lock: {e}")))
+    }
+
+    fn register(
+        &self,
+        py: Python,
+        source_filter: RustUUri,
+        listener: Arc<dyn UListener>,
+        callback: Option<PyObject>,
+    ) -> PyResult<ListenerHandle> {
         let transport = self.transport.clone();
-        let rust_uri = source_filter.inner.clone();
+        let rust_listener = listener.clone();
+        let rust_uri = source_filter.clone();
 
-        self.runtime
-            .block_on(async move {
+        let runtime = &self.runtime;
+        py.allow_threads(|| {
+            runtime.block_on(async move {
                 transport
                     .as_ref()
-                    .unregister_listener(&rust_uri, None, rust_listener)
+                    .register_listener(&rust_uri, None, rust_listener)
                     .await
             })
-            .map_err(|e| PyException::new_err(format!("Failed to unregister listener: {e}")))
+        })
+            .map_err(|e| PyException::new_err(format!("Failed to register listener: {e}")))?;
+        Ok(self.lock_listeners()?.insert(source_filter, listener, callback))
     }
 }
 
@@ -153,11 +255,113 @@ impl UPTransportZenoh {
 #[pyclass(name = "UPTransportZenohBuilder")]
 pub struct UPTransportZenohBuilder {
     authority: String,
+    batching: bool,
+    mode: Option<String>,
+    listen: Vec<String>,
+    connect: Vec<String>,
     runtime: Runtime,
 }
 
 #[pymethods]
 impl UPTransportZenohBuilder {
+    /// Enable or disable Zenoh's automatic batching of small messages
+    ///
+    /// Batching is enabled by default and packs consecutive messages into one
+    /// network frame, which raises throughput for bursts of small messages.
+    /// Disabling it sends every message in its own frame as soon as possible,
+    /// trading throughput for lower per-message latency.
+    ///
+    /// Args:
+    ///     enabled: Whether outgoing messages may be batched
+    ///
+    /// Returns:
+    ///     UPTransportZenohBuilder: The same builder, for chaining
+    ///
+    /// Example:
+    ///     ```python
+    ///     transport = UPTransportZenoh.builder("my-vehicle").batching(False).build()
+    ///     ```
+    fn batching(mut slf: PyRefMut<'_, Self>, enabled: bool) -> PyRefMut<'_, Self> {
+        slf.batching = enabled;
+        slf
+    }
+
+    /// Set the Zenoh session mode
+    ///
+    /// * `"peer"` (Zenoh's default) connects directly to other peers. Peers
+    ///   find each other through multicast scouting, or through the endpoints
+    ///   given with `listen()` and `connect()`.
+    /// * `"client"` connects to a Zenoh router, which forwards all traffic.
+    ///   Use it when peers cannot reach each other directly.
+    /// * `"router"` runs a router inside this process.
+    ///
+    /// If not set, Zenoh's default mode is used.
+    ///
+    /// Args:
+    ///     mode: One of "peer", "client" or "router"
+    ///
+    /// Returns:
+    ///     UPTransportZenohBuilder: The same builder, for chaining
+    ///
+    /// Raises:
+    ///     Exception: If the mode is not one of the above
+    ///
+    /// Example:
+    ///     ```python
+    ///     transport = UPTransportZenoh.builder("my-vehicle").mode("peer").build()
+    ///     ```
+    fn mode<'py>(mut slf: PyRefMut<'py, Self>, mode: &str) -> PyResult<PyRefMut<'py, Self>> {
+        match mode {
+            "peer" | "client" | "router" => {
+                slf.mode = Some(mode.to_string());
+                Ok(slf)
+            }
+            _ => Err(PyException::new_err(format!(
+                "Invalid Zenoh mode '{mode}': expected 'peer', 'client' or 'router'"
+            ))),
+        }
+    }
+
+    /// Add an endpoint this session listens on for incoming connections
+    ///
+    /// Together with `connect()` this lets sessions reach each other without
+    /// multicast scouting, which is often unavailable in containers and CI.
+    /// May be called more than once.
+    ///
+    /// Args:
+    ///     endpoint: A Zenoh locator such as "tcp/127.0.0.1:7447"
+    ///
+    /// Returns:
+    ///     UPTransportZenohBuilder: The same builder, for chaining
+    ///
+    /// Example:
+    ///     ```python
+    ///     transport = UPTransportZenoh.builder("my-vehicle").listen("tcp/127.0.0.1:7447").build()
+    ///     ```
+    fn listen<'py>(mut slf: PyRefMut<'py, Self>, endpoint: &str) -> PyRefMut<'py, Self> {
+        slf.listen.push(endpoint.to_string());
+        slf
+    }
+
+    /// Add an endpoint this session connects to when it is built
+    ///
+    /// May be called more than once.
+    ///
+    /// Args:
+    ///     endpoint: A Zenoh locator such as "tcp/127.0.0.1:7447"
+    ///
+    /// Returns:
+    ///     UPTransportZenohBuilder: The same builder, for chaining
+    ///
+    /// Example:
+    ///     ```python
+    ///     transport = UPTransportZenoh.builder("my-vehicle").connect("tcp/127.0.0.1:7447").build()
+    ///     ```
+    fn connect<'py>(mut slf: PyRefMut<'py, Self>, endpoint: &str) -> PyRefMut<'py, Self> {
+        slf.connect.push(endpoint.to_string());
+        slf
+    }
+
     /// Build the UPTransportZenoh instance
     ///
     /// Returns:
@@ -172,11 +376,33 @@ impl UPTransportZenohBuilder {
     ///     ```
     fn build(mut slf: PyRefMut<Self>) -> PyResult<UPTransportZenoh> {
         let authority = slf.authority.clone();
+
+        let mut config = zenoh_config::Config::default();
+        if !slf.batching {
+            config
+                .insert_json5("transport/link/tx/queue/batching/enabled", "false")
+                .map_err(|e| PyException::new_err(format!("Failed to disable batching: {e}")))?;
+        }
+        if let Some(mode) = &slf.mode {
+            config
+                .insert_json5("mode", &format!("\"{mode}\""))
+                .map_err(|e| PyException::new_err(format!("Failed to set mode: {e}")))?;
+        }
+        if !slf.listen.is_empty() {
+            config
+                .insert_json5("listen/endpoints", &format!("{:?}", slf.listen))
+                .map_err(|e| PyException::new_err(format!("Failed to set listen endpoints: {e}")))?;
+        }
+        if !slf.connect.is_empty() {
+            config
+                .insert_json5("connect/endpoints", &format!("{:?}", slf.connect))
+                .map_err(|e| PyException::new_err(format!("Failed to set connect endpoints: {e}")))?;
+        }
         
         let transport = slf.runtime.block_on(async move {
             RustUPTransportZenoh::builder(&authority)
                 .map_err(|e| format!("Failed to create builder: {e}"))?
-                .with_config(zenoh_config::Config::default())
+                .with_config(config)
                 .build()
                 .await
                 .map_err(|e| format!("Failed to build transport: {e}"))
@@ -186,31 +412,7 @@ impl UPTransportZenohBuilder {
             transport: Arc::new(transport),
             runtime: Runtime::new()
                 .map_err(|e| PyException::new_err(format!("Failed to create runtime: {e}")))?,
+            listeners: Mutex::new(ListenerRegistry::default()),
         })
     }
 }
-
-/// Bridges Python callable to Rust UListener trait
-struct PythonListener {
-    callback: PyObject,
-}
-
-impl PythonListener {
-    fn new(callback: PyObject) -> Self {
-        Self { callback }
-    }
-}
-
-#[async_trait::async_trait]
-impl UListener for PythonListener {
-    async fn on_receive(&self, msg: UMessage) {
-        Python::with_gil(|py| {
-            let py_msg = crate::local_transport::UMessage {
-                inner: msg,
-            };
-            if let Err(e) = self.callback.call1(py, (py_msg,)) {
-                eprintln!("Error calling Python listener: {:?}", e);
-            }
-        });
-    }
-}
@@ -0,0 +1,71 @@
+"""Shared pytest configuration and fixtures
+
+Tests can run in parallel with pytest-xdist:
+
+    uv run pytest -n auto --dist loadgroup
+
+Zenoh sessions opened by different workers discover each other on the local
+network, so every test in a module that uses the Zenoh transport is placed in
+a single ``zenoh`` group and runs on one worker.
+"""
+
+import sys
+from threading import Event
+
+import pytest
+
+
+def pytest_configure(config):
+    # Registered by pytest-xdist as well; repeated here so runs without it stay warning-free
+    config.addinivalue_line("markers", "xdist_group(name): run all tests of a group on one xdist worker")
+
+
+def _extract_string(msg):
+    return msg.extract_string()
+
+
+def _make_collector(count=1, extract=_extract_string):
+    received = []
+    done = Event()
+
+    def listener(msg):
+        item = extract(msg)
+        if item is None:
+            return
+        received.append(item)
+        if len(received) >= count:
+            done.set()
+
+    return listener, received, done
+
+
+@pytest.fixture
+def collector():
+    """Build listeners that record what they receive
+
+    ``collector(count=1, extract=...)`` returns ``(listener, received, done)``.
+    The listener appends ``extract(msg)`` to ``received``, skipping None, and
+    sets the ``done`` event once ``count`` items have arrived. ``extract``
+    defaults to ``msg.extract_string()``.
+    """
+    return _make_collector
+
+
+def _uses_zenoh_transport(module):
+    zenoh_transport = sys.modules.get("up_py_rs.zenoh_transport")
+    if zenoh_transport is None:
+        return False
+    # Without zenoh support the shim's classes are missing, so nothing matches them
+    exported = [getattr(zenoh_transport, name, None) for name in getattr(zenoh_transport, "__all__", ())]
+    exported = [obj for obj in exported if obj is not None]
+    return any(
+        value is zenoh_transport or any(value is obj for obj in exported)
+        for value in vars(module).values()
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        module = getattr(item, "module", None)
+        if module is not None and _uses_zenoh_transport(module):
+            item.add_marker(pytest.mark.xdist_group("zenoh"))
@@ -1,33 +1,42 @@
 """Tests for SimpleNotifier functionality"""
 
 import pytest
-import time
-from threading import Event
 
-from up_py_rs import StaticUriProvider
+from up_py_rs import ListenerHandle, StaticUriProvider
 from up_py_rs.communication import SimpleNotifier, UPayload
 from up_py_rs.local_transport import LocalTransport
 
 
+@pytest.fixture(scope="module")
+def uri_provider():
+    """URI provider shared by every test in this module"""
+    return StaticUriProvider("test-vehicle", 0xa34b, 0x01)
+
+
+@pytest.fixture(scope="module")
+def shared_notifier(uri_provider):
+    """Notifier shared by tests that send without listening"""
+    return SimpleNotifier(LocalTransport(), uri_provider)
+
+
+@pytest.fixture
+def transport():
+    """Fresh transport for tests that register listeners"""
+    return LocalTransport()
+
+
 class TestSimpleNotifier:
     """Tests for SimpleNotifier"""
 
-    def test_create_notifier(self):
+    def test_create_notifier(self, shared_notifier):
         """Test creating a SimpleNotifier instance"""
-        uri_provider = StaticUriProvider("test-vehicle", 0xa34b, 0x01)
-        transport = LocalTransport()
-        
-        notifier = SimpleNotifier(transport, uri_provider)
-        
-        assert notifier is not None
-        assert hasattr(notifier, "notify")
-        assert hasattr(notifier, "start_listening")
-        assert hasattr(notifier, "stop_listening")
+        assert shared_notifier is not None
+        assert hasattr(shared_notifier, "notify")
+        assert hasattr(shared_notifier, "start_listening")
+        assert hasattr(shared_notifier, "stop_listening")
 
-    def test_notifier_start_listening(self):
+    def test_notifier_start_listening(self, transport, uri_provider):
         """Test starting to listen for notifications"""
-        uri_provider = StaticUriProvider("test-vehicle", 0xa34b, 0x01)
-        transport = LocalTransport()
         notifier = SimpleNotifier(transport, uri_provider)
         
         received_messages = []
@@ -39,13 +48,12 @@ class TestSimpleNotifier:
         
         topic = uri_provider.get_resource_uri(0xd100)
         
-        # Should not raise an exception
-        notifier.start_listening(topic, listener)
+        handle = notifier.start_listening(topic, listener)
+        
+        assert isinstance(handle, ListenerHandle)
 
-    def test_notifier_stop_listening(self):
+    def test_notifier_stop_listening(self, transport, uri_provider):
         """Test stopping listening for notifications"""
-        uri_provider = StaticUriProvider("test-vehicle", 0xa34b, 0x01)
-        transport = LocalTransport()
         notifier = SimpleNotifier(transport, uri_provider)
         
         def listener(msg):
@@ -53,46 +61,58 @@ class TestSimpleNotifier:
         
         topic = uri_provider.get_resource_uri(0xd100)
         
-        notifier.start_listening(topic, listener)
+        handle = notifier.start_listening(topic, listener)
         
         # Should not raise an exception
-        notifier.stop_listening(topic, listener)
+        notifier.stop_listening(handle)
+        
+        # The handle is consumed by stopping
+        with pytest.raises(Exception):
+            notifier.stop_listening(handle)
 
-    def test_notifier_send_notification(self):
-        """Test sending a notification"""
-        uri_provider = StaticUriProvider("test-vehicle", 0xa34b, 0x01)
-        transport = LocalTransport()
+    def test_notifier_stop_listening_by_callback_is_deprecated(self, transport, uri_provider):
+        """Test the deprecated topic/callback form of stop_listening"""
         notifier = SimpleNotifier(transport, uri_provider)
         
+        def listener(msg):
+            pass
+        
+        topic = uri_provider.get_resource_uri(0xd100)
+        notifier.start_listening(topic, listener)
+        
+        with pytest.warns(DeprecationWarning):
+            notifier.stop_listening(topic, listener)
+
+    def test_notifier_send_notification(self, shared_notifier, uri_provider):
+        """Test sending a notification"""
         payload = UPayload.from_string("Test notification")
         destination = uri_provider.get_source_uri()
         resource_id = 0xd100
         
         # Should not raise an exception
-        notifier.notify(resource_id, destination, payload)
+        shared_notifier.notify(resource_id, destination, payload)
 
-    def test_notifier_full_flow(self):
-        """Test complete notification flow: listen, send, receive"""
-        uri_provider = StaticUriProvider("test-vehicle", 0xa34b, 0x01)
-        transport = LocalTransport()
-        notifier = SimpleNotifier(transport, uri_provider)
+    def test_notifier_send_notification_with_priority(self, shared_notifier, uri_provider):
+        """Test sending a notification with an explicit priority"""
+        payload = UPayload.from_string("Test notification")
+        destination = uri_provider.get_source_uri()
         
-        received_messages = []
-        message_received = Event()
+        # Should not raise an exception
+        shared_notifier.notify(0xd100, destination, payload, priority="DataHigh")
         
-        def listener(msg):
-            text = msg.extract_string()
-            if text:
-                received_messages.append(text)
-                message_received.set()
+        with pytest.raises(Exception, match="Invalid priority"):
+            shared_notifier.notify(0xd100, destination, payload, priority="Urgent")
+
+    def test_notifier_full_flow(self, transport, uri_provider, collector):
+        """Test complete notification flow: listen, send, receive"""
+        notifier = SimpleNotifier(transport, uri_provider)
+        listener, received_messages, message_received = collector()
         
         # Start listening
         resource_id = 0xd100
         topic = uri_provider.get_resource_uri(resource_id)
-        notifier.start_listening(topic, listener)
-        
-        # Give time for listener to be registered
-        time.sleep(0.1)
+        # The listener is live as soon as start_listening returns
+        handle = notifier.start_listening(topic, listener)
         
         # Send notification
         test_message = "Hello from notifier!"
@@ -104,88 +124,67 @@ class TestSimpleNotifier:
         received = message_received.wait(timeout=1.0)
         
         # Cleanup
-        notifier.stop_listening(topic, listener)
+        notifier.stop_listening(handle)
         
         # Verify
         assert received, "Message was not received"
         assert test_message in received_messages
 
-    def test_notifier_multiple_messages(self):
+    def test_notifier_multiple_messages(self, transport, uri_provider, collector):
         """Test sending multiple notifications"""
-        uri_provider = StaticUriProvider("test-vehicle", 0xa34b, 0x01)
-        transport = LocalTransport()
         notifier = SimpleNotifier(transport, uri_provider)
-        
-        received_messages = []
-        
-        def listener(msg):
-            text = msg.extract_string()
-            if text:
-                received_messages.append(text)
+        listener, received_messages, all_received = collector(3)
         
         resource_id = 0xd100
         topic = uri_provider.get_resource_uri(resource_id)
-        notifier.start_listening(topic, listener)
+        handle = notifier.start_listening(topic, listener)
         
-        time.sleep(0.1)
-        
-        # Send multiple notifications
+        # Send multiple notifications back to back
         destination = uri_provider.get_source_uri()
         for i in range(3):
             message = f"Notification {i+1}"
             payload = UPayload.from_string(message)
             notifier.notify(resource_id, destination, payload)
-            time.sleep(0.05)
         
         # Wait for messages to be processed
-        time.sleep(0.2)
+        received = all_received.wait(timeout=1.0)
         
-        notifier.stop_listening(topic, listener)
+        notifier.stop_listening(handle)
         
+        assert received, "Not all messages were received"
         assert len(received_messages) == 3
         assert "Notification 1" in received_messages
         assert "Notification 2" in received_messages
         assert "Notification 3" in received_messages
 
-    def test_notifier_with_none_payload(self):
+    def test_notifier_with_none_payload(self, shared_notifier, uri_provider):
         """Test sending notification with None payload"""
-        uri_provider = StaticUriProvider("test-vehicle", 0xa34b, 0x01)
-        transport = LocalTransport()
-        notifier = SimpleNotifier(transport, uri_provider)
-        
         destination = uri_provider.get_source_uri()
         resource_id = 0xd100
         
         # Should not raise an exception
-        notifier.notify(resource_id, destination, None)
+        shared_notifier.notify(resource_id, destination, None)
 
-    def test_notifier_with_bytes_payload(self):
+    def test_notifier_with_bytes_payload(self, transport, uri_provider, collector):
         """Test sending notification with bytes payload"""
-        uri_provider = StaticUriProvider("test-vehicle", 0xa34b, 0x01)
-        transport = LocalTransport()
         notifier = SimpleNotifier(transport, uri_provider)
-        
-        received_count = [0]
-        
-        def listener(msg):
-            received_count[0] += 1
+        listener, received_payloads, message_received = collector(extract=lambda msg: msg.extract_bytes())
         
         resource_id = 0xd100
         topic = uri_provider.get_resource_uri(resource_id)
-        notifier.start_listening(topic, listener)
-        
-        time.sleep(0.1)
+        handle = notifier.start_listening(topic, listener)
         
         # Send with bytes payload
-        payload = UPayload.from_bytes([0x48, 0x65, 0x6c, 0x6c, 0x6f])
+        payload = UPayload.from_bytes(b"Hello")
         destination = uri_provider.get_source_uri()
         notifier.notify(resource_id, destination, payload)
         
-        time.sleep(0.2)
+        received = message_received.wait(timeout=1.0)
         
-        notifier.stop_listening(topic, listener)
+        notifier.stop_listening(handle)
         
-        assert received_count[0] > 0
+        assert received, "Message was not received"
+        assert received_payloads == [b"Hello"]
 
 
 if __name__ == '__main__':
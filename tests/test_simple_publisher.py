@@ -1,75 +1,203 @@
+import array
+import ctypes
+import struct
 import pytest
+from threading import Thread
 
-from up_py_rs import StaticUriProvider
-from up_py_rs.communication import SimplePublisher, UPayload
+from up_py_rs import ListenerHandle, StaticUriProvider, StringListener, cached_uri_provider
+from up_py_rs.communication import SimplePublisher, UPayload, UPayloadBuilder
 from up_py_rs.local_transport import LocalTransport
 
 
+NATIVE_CALLBACK = ctypes.CFUNCTYPE(
+    None, ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t, ctypes.c_void_p
+)
+
+
+@pytest.fixture(scope="module")
+def uri_provider():
+    """URI provider shared by every test in this module"""
+    return StaticUriProvider("my-vehicle", 0xA34B, 0x01)
+
+
+@pytest.fixture(scope="module")
+def shared_transport():
+    """Transport shared by tests that publish without listening"""
+    return LocalTransport()
+
+
+@pytest.fixture(scope="module")
+def publisher(shared_transport, uri_provider):
+    """Publisher on the shared transport"""
+    return SimplePublisher(shared_transport, uri_provider)
+
+
+@pytest.fixture
+def transport():
+    """Fresh transport for tests that register listeners"""
+    return LocalTransport()
+
+
 class TestSimplePublisher:
     """Tests SimplePublisher"""
 
-    def test_create_publisher(self):
+    def test_create_publisher(self, shared_transport, uri_provider):
         """Test creating SimplePublisher instance"""
-        uri_provider = StaticUriProvider("my-vehicle", 0xA34B, 0x01)
-        transport = LocalTransport()
-
-        publisher = SimplePublisher(transport, uri_provider)
+        publisher = SimplePublisher(shared_transport, uri_provider)
 
         assert publisher is not None
         assert hasattr(publisher, "publish")
 
-    def test_publisher_with_string_payload(self):
+    def test_publisher_with_string_payload(self, publisher):
         """Test publishing with string payload"""
-        uri_provider = StaticUriProvider("my-vehicle", 0xA34B, 0x01)
-        transport = LocalTransport()
-        publisher = SimplePublisher(transport, uri_provider)
-        
         payload = UPayload.from_string("Test message")
         # Should not raise exception
         publisher.publish(0x8001, payload)
 
-    def test_publisher_with_bytes_payload(self):
+    def test_publisher_with_bytes_payload(self, publisher):
         """Test publishing with bytes payload"""
-        uri_provider = StaticUriProvider("my-vehicle", 0xA34B, 0x01)
-        transport = LocalTransport()
-        publisher = SimplePublisher(transport, uri_provider)
-        
-        payload = UPayload.from_bytes([0x01, 0x02, 0x03, 0x04])
+        payload = UPayload.from_bytes(b"\x01\x02\x03\x04")
         # Should not raise exception
         publisher.publish(0x8001, payload)
 
-    def test_publisher_with_none_payload(self):
+    def test_publisher_with_none_payload(self, publisher):
         """Test publishing without payload"""
-        uri_provider = StaticUriProvider("my-vehicle", 0xA34B, 0x01)
-        transport = LocalTransport()
-        publisher = SimplePublisher(transport, uri_provider)
-        
         # Should not raise exception
         publisher.publish(0x8001, None)
 
-    def test_publisher_multiple_messages(self):
+    def test_publisher_multiple_messages(self, publisher):
         """Test publishing multiple messages"""
-        uri_provider = StaticUriProvider("my-vehicle", 0xA34B, 0x01)
-        transport = LocalTransport()
-        publisher = SimplePublisher(transport, uri_provider)
-        
         # Publish multiple messages - should not raise exception
         for i in range(5):
             payload = UPayload.from_string(f"Message {i}")
             publisher.publish(0x8001, payload)
 
-    def test_publisher_different_resource_ids(self):
-        """Test publishing to different resource IDs"""
-        uri_provider = StaticUriProvider("my-vehicle", 0xA34B, 0x01)
-        transport = LocalTransport()
+    def test_publisher_publish_many(self, transport, uri_provider, collector):
+        """Test publishing several payloads to one resource in a single call"""
+        publisher = SimplePublisher(transport, uri_provider)
+        listener, received_messages, all_received = collector(5)
+        
+        transport.register_listener(uri_provider, 0x8001, listener)
+        
+        payloads = [UPayload.from_string(f"Message {i}") for i in range(5)]
+        publisher.publish_many(0x8001, payloads)
+        
+        assert all_received.wait(timeout=1.0), "Not all messages were received"
+        assert received_messages == [f"Message {i}" for i in range(5)]
+
+    def test_publisher_publish_many_iterable(self, publisher):
+        """Test that publish_many accepts any iterable of payloads"""
+        # Should not raise exception
+        publisher.publish_many(0x8001, (UPayload.from_u32(i) for i in range(3)))
+        publisher.publish_many(0x8001, (UPayload.from_string("tuple"), None))
+
+        with pytest.raises(TypeError):
+            publisher.publish_many(0x8001, 42)
+        with pytest.raises(TypeError):
+            publisher.publish_many(0x8001, ["not a payload"])
+
+    def test_publisher_publish_batch(self, publisher):
+        """Test publishing (resource_id, payload) pairs in a single call"""
+        # Should not raise exception
+        publisher.publish_batch([
+            (0x8001, UPayload.from_string("first")),
+            (0x8002, UPayload.from_bytes(b"\x01\x02")),
+            (0x8003, None),
+        ])
+
+    def test_publisher_publish_bytes(self, transport, uri_provider, collector):
+        """Test publishing raw bytes without a UPayload object"""
+        publisher = SimplePublisher(transport, uri_provider)
+        listener, received, all_received = collector(2, lambda msg: msg.extract_bytes())
+        
+        transport.register_listener(uri_provider, 0x8001, listener)
+        publisher.publish_bytes(0x8001, b"Hello")
+        values = array.array("H", [1, 2, 3])
+        publisher.publish_bytes(0x8001, memoryview(values))
+        
+        assert all_received.wait(timeout=1.0), "Not all messages were received"
+        assert received == [b"Hello", values.tobytes()]
+
+    def test_publisher_with_priority(self, transport, uri_provider, collector):
+        """Test publishing with an explicit message priority"""
+        publisher = SimplePublisher(transport, uri_provider)
+        listener, received, all_received = collector(2)
+        
+        transport.register_listener(uri_provider, 0x8001, listener)
+        publisher.publish(0x8001, UPayload.from_string("urgent"), priority="RealTime")
+        publisher.publish(0x8001, UPayload.from_string("bulk"), priority="CS1")
+        
+        assert all_received.wait(timeout=1.0), "Not all messages were received"
+        assert received == ["urgent", "bulk"]
+
+    def test_publisher_batch_methods_with_priority(self, transport, uri_provider, collector):
+        """Test that every publish entry point accepts a priority"""
         publisher = SimplePublisher(transport, uri_provider)
+        listener, received, all_received = collector(5, lambda msg: msg.extract_bytes())
         
+        transport.register_listener(uri_provider, 0x8001, listener)
+        publisher.publish_bytes(0x8001, b"a", priority="DataHigh")
+        publisher.publish_many(0x8001, [UPayload.from_bytes(b"b")], priority="Background")
+        publisher.publish_batch([(0x8001, UPayload.from_text("c"))], priority="CS5")
+        publisher.publish_to_all([0x8001, 0x8001], UPayload.from_text("d"), priority="RealTime")
+        
+        assert all_received.wait(timeout=1.0), "Not all messages were received"
+        assert received == [b"a", b"b", b"c", b"d", b"d"]
+
+    def test_publisher_invalid_priority(self, publisher):
+        """Test that an unknown priority name is rejected"""
+        with pytest.raises(Exception, match="Invalid priority"):
+            publisher.publish(0x8001, UPayload.from_string("Test"), priority="Urgent")
+        with pytest.raises(Exception, match="Invalid priority"):
+            publisher.publish_bytes(0x8001, b"Test", priority="Urgent")
+        with pytest.raises(Exception, match="Invalid priority"):
+            publisher.publish_many(0x8001, [None], priority="Urgent")
+        with pytest.raises(Exception, match="Invalid priority"):
+            publisher.publish_batch([(0x8001, None)], priority="Urgent")
+        with pytest.raises(Exception, match="Invalid priority"):
+            publisher.publish_to_all([0x8001], None, priority="Urgent")
+
+    def test_publisher_concurrent_threads(self, transport, uri_provider, collector):
+        """Test publishing from several Python threads at once"""
+        publisher = SimplePublisher(transport, uri_provider)
+        listener, received_messages, all_received = collector(20)
+        
+        transport.register_listener(uri_provider, 0x8001, listener)
+        
+        def publish_messages(worker):
+            for i in range(5):
+                publisher.publish(0x8001, UPayload.from_string(f"{worker}-{i}"))
+        
+        workers = [Thread(target=publish_messages, args=(w,)) for w in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=5.0)
+        
+        assert all_received.wait(timeout=1.0), "Not all messages were received"
+        assert sorted(received_messages) == sorted(f"{w}-{i}" for w in range(4) for i in range(5))
+
+    def test_publisher_different_resource_ids(self, publisher):
+        """Test publishing to different resource IDs"""
         payload = UPayload.from_string("Test")
         
         # Publish to different resource IDs
         for resource_id in [0x8001, 0x8002, 0x8003]:
             publisher.publish(resource_id, payload)
 
+    def test_publisher_publish_to_all(self, transport, uri_provider, collector):
+        """Test publishing one payload to several resources in a single call"""
+        publisher = SimplePublisher(transport, uri_provider)
+        resource_ids = [0x8001, 0x8002, 0x8003]
+        listener, received, all_received = collector(len(resource_ids))
+        
+        for resource_id in resource_ids:
+            transport.register_listener(uri_provider, resource_id, listener)
+        publisher.publish_to_all(resource_ids, UPayload.from_string("Broadcast"))
+        
+        assert all_received.wait(timeout=1.0), "Not all messages were received"
+        assert received == ["Broadcast"] * len(resource_ids)
+
 
 class TestUPayload:
     """Tests for UPayload"""
@@ -79,11 +207,57 @@ class TestUPayload:
         payload = UPayload.from_string("Hello World")
         assert payload is not None
 
+    def test_payload_from_text(self):
+        """Test creating a plain-text payload"""
+        payload = UPayload.from_text("Hello World")
+        assert payload is not None
+
+    def test_payload_from_numbers(self):
+        """Test creating raw payloads from numbers"""
+        assert UPayload.from_u32(42) is not None
+        assert UPayload.from_f64(21.5) is not None
+        with pytest.raises(OverflowError):
+            UPayload.from_u32(-1)
+
+    def test_payload_from_struct_invalid(self):
+        """Test that mismatched formats and arguments are rejected"""
+        with pytest.raises(Exception):
+            UPayload.from_struct("<I")
+        with pytest.raises(Exception):
+            UPayload.from_struct("<I", 1, 2)
+        with pytest.raises(Exception):
+            UPayload.from_struct("<z", 1)
+        # struct's default is native '@' with padding, so a prefix is required
+        with pytest.raises(Exception, match="byte order prefix"):
+            UPayload.from_struct("Id", 7, 21.5)
+        with pytest.raises(Exception, match="byte order prefix"):
+            UPayload.from_struct("@I", 7)
+
     def test_payload_from_bytes(self):
         """Test creating payload from bytes"""
+        payload = UPayload.from_bytes(b"Hello")
+        assert payload is not None
+
+    def test_payload_from_bytes_like(self):
+        """Test creating payload from bytearray and memoryview"""
+        assert UPayload.from_bytes(bytearray(b"Hello")) is not None
+        assert UPayload.from_bytes(memoryview(b"Hello")) is not None
+
+    def test_payload_from_bytes_list(self):
+        """Test creating payload from a list of ints (backward compatible)"""
         payload = UPayload.from_bytes([0x48, 0x65, 0x6c, 0x6c, 0x6f])
         assert payload is not None
 
+    def test_payload_from_bytes_invalid(self):
+        """Test that non-byte values are rejected"""
+        with pytest.raises(Exception):
+            UPayload.from_bytes([256])
+        # Other buffer exporters must be wrapped in a memoryview
+        with pytest.raises(TypeError):
+            UPayload.from_bytes(array.array("B", b"Hello"))
+        with pytest.raises(TypeError):
+            UPayload.from_bytes("Hello")
+
     def test_payload_from_empty_string(self):
         """Test creating payload from empty string"""
         payload = UPayload.from_string("")
@@ -91,8 +265,62 @@ class TestUPayload:
 
     def test_payload_from_empty_bytes(self):
         """Test creating payload from empty bytes"""
-        payload = UPayload.from_bytes([])
+        payload = UPayload.from_bytes(b"")
+        assert payload is not None
+
+
+class TestUPayloadBuilder:
+    """Tests for UPayloadBuilder"""
+
+    def test_builder_finish(self):
+        """Test building a payload from written text and bytes"""
+        builder = UPayloadBuilder(16)
+        builder.write_str("Hello")
+        builder.write_bytes(b", World")
+        assert len(builder) == 12
+        
+        payload = builder.finish()
         assert payload is not None
+        assert len(builder) == 0
+
+    def test_builder_write_bytes_like(self):
+        """Test that write_bytes accepts the same types as UPayload.from_bytes"""
+        builder = UPayloadBuilder()
+        builder.write_bytes(bytearray(b"ab"))
+        builder.write_bytes(memoryview(b"cd"))
+        builder.write_bytes([0x65, 0x66])
+        assert len(builder) == 6
+        
+        with pytest.raises(TypeError):
+            builder.write_bytes("text")
+
+    def test_builder_reset(self):
+        """Test discarding partially written data"""
+        builder = UPayloadBuilder()
+        builder.write_str("discard me")
+        builder.reset()
+        assert len(builder) == 0
+
+    def test_builder_reuse(self, transport, uri_provider, collector):
+        """Test reusing one builder for several publishes"""
+        publisher = SimplePublisher(transport, uri_provider)
+        builder = UPayloadBuilder(64)
+        listener, received, all_received = collector(
+            6, lambda msg: (msg.extract_string(), msg.extract_bytes())
+        )
+        
+        transport.register_listener(uri_provider, 0x8001, listener)
+        for i in range(5):
+            builder.write_str(f"Message {i}")
+            publisher.publish(0x8001, builder.finish())
+        builder.write_str("Hello")
+        builder.write_bytes(b"\x00\x01")
+        publisher.publish(0x8001, builder.finish())
+        
+        assert all_received.wait(timeout=1.0), "Not all messages were received"
+        assert received[:5] == [(f"Message {i}", f"Message {i}".encode()) for i in range(5)]
+        # Once bytes are written the payload is raw, not text
+        assert received[5] == (None, b"Hello\x00\x01")
 
 
 class TestStaticUriProvider:
@@ -115,6 +343,33 @@ class TestStaticUriProvider:
         uri = provider.get_source_uri()
         assert uri is not None
 
+    def test_uris_are_cached(self):
+        """Test that repeated lookups return the same UUri object"""
+        provider = StaticUriProvider("test-vehicle", 0x1234, 0x01)
+        assert provider.get_resource_uri(0x8001) is provider.get_resource_uri(0x8001)
+        assert provider.get_resource_uri(0x8001) is not provider.get_resource_uri(0x8002)
+        assert provider.get_source_uri() is provider.get_source_uri()
+
+    def test_cached_uri_provider(self):
+        """Test the Python-side memoizing wrapper"""
+        provider = StaticUriProvider("test-vehicle", 0x1234, 0x01)
+        cached = cached_uri_provider(provider)
+        
+        assert cached.provider is provider
+        assert cached.get_resource_uri(0x8001) is provider.get_resource_uri(0x8001)
+        assert cached.get_source_uri() is provider.get_source_uri()
+        
+        cached.get_resource_uri(0x8001)
+        assert cached.get_resource_uri.cache_info().hits >= 1
+
+    def test_uri_str_is_cached(self):
+        """Test that str() of a UUri is formatted once and reused"""
+        provider = StaticUriProvider("test-vehicle", 0x1234, 0x01)
+        topic = provider.get_resource_uri(0x8001)
+        assert str(topic) == "//test-vehicle/1234/1/8001"
+        assert str(topic) is str(topic)
+        assert repr(topic) == "UUri('//test-vehicle/1234/1/8001')"
+
 
 class TestLocalTransport:
     """Tests for LocalTransport"""
@@ -124,32 +379,176 @@ class TestLocalTransport:
         transport = LocalTransport()
         assert transport is not None
 
-    def test_register_listener(self):
+    def test_register_listener(self, transport, uri_provider):
         """Test registering a listener"""
-        transport = LocalTransport()
-        provider = StaticUriProvider("test-vehicle", 0x1234, 0x01)
-        
         def listener(msg):
             pass
         
         # Should not raise exception
-        transport.register_listener(provider, 0x8001, listener)
+        transport.register_listener(uri_provider, 0x8001, listener)
 
-    def test_unregister_listener(self):
-        """Test unregistering a listener"""
-        transport = LocalTransport()
-        provider = StaticUriProvider("test-vehicle", 0x1234, 0x01)
+    def test_string_listener(self, transport, uri_provider, collector):
+        """Test that a StringListener receives decoded text"""
+        publisher = SimplePublisher(transport, uri_provider)
+        on_text, received_texts, message_received = collector(extract=lambda text: text)
+        
+        transport.register_listener(uri_provider, 0x8001, StringListener(on_text))
+        
+        # Non-string payloads are not delivered
+        publisher.publish(0x8001, None)
+        publisher.publish(0x8001, UPayload.from_string("Hello"))
+        
+        assert message_received.wait(timeout=1.0), "Message was not received"
+        assert received_texts == ["Hello"]
+
+    def test_extract_string_from_text_payload(self, transport, uri_provider, collector):
+        """Test that text payloads are read back by extract_string and StringListener"""
+        publisher = SimplePublisher(transport, uri_provider)
+        on_text, received_texts, all_received = collector(2, lambda text: text)
+        
+        transport.register_listener(uri_provider, 0x8001, lambda msg: on_text(msg.extract_string()))
+        transport.register_listener(uri_provider, 0x8001, StringListener(on_text))
+        publisher.publish(0x8001, UPayload.from_text("Grüße"))
+        
+        assert all_received.wait(timeout=1.0), "Message was not received"
+        assert received_texts == ["Grüße", "Grüße"]
+
+    def test_extract_bytes(self, transport, uri_provider, collector):
+        """Test reading raw payload bytes from a received message"""
+        publisher = SimplePublisher(transport, uri_provider)
+        listener, received_payloads, message_received = collector(
+            2, lambda msg: (msg.extract_bytes(), msg.extract_string())
+        )
+        
+        transport.register_listener(uri_provider, 0x8001, listener)
+        publisher.publish(0x8001, UPayload.from_bytes(b"\x00\x01\xff"))
+        publisher.publish_bytes(0x8001, b"\x00\x01\xff")
+        
+        assert message_received.wait(timeout=1.0), "Message was not received"
+        # from_bytes and publish_bytes both send RAW, so neither decodes as a string
+        assert received_payloads == [(b"\x00\x01\xff", None)] * 2
+
+    def test_numeric_payloads_match_struct(self, transport, uri_provider, collector):
+        """Test that numeric payloads carry the same bytes as struct.pack"""
+        publisher = SimplePublisher(transport, uri_provider)
+        listener, received_payloads, all_received = collector(4, lambda msg: msg.extract_bytes())
+        
+        transport.register_listener(uri_provider, 0x8001, listener)
+        publisher.publish_many(0x8001, [
+            UPayload.from_u32(0xdeadbeef),
+            UPayload.from_f64(-1.25),
+            UPayload.from_struct("<hBxq?3s", -2, 255, 1 << 40, True, b"ab"),
+            UPayload.from_struct(">2Hd", 1, 2, 0.5),
+        ])
+        
+        assert all_received.wait(timeout=1.0), "Not all messages were received"
+        assert received_payloads == [
+            struct.pack("<I", 0xdeadbeef),
+            struct.pack("<d", -1.25),
+            struct.pack("<hBxq?3s", -2, 255, 1 << 40, True, b"ab"),
+            struct.pack(">2Hd", 1, 2, 0.5),
+        ]
+
+    def test_fan_out_to_multiple_listeners(self, transport, uri_provider, collector):
+        """Test that every listener on a resource receives the same payload"""
+        publisher = SimplePublisher(transport, uri_provider)
+        listener_count = 4
+        payload = bytes(range(256)) * 16
+        listener, received_payloads, all_received = collector(
+            listener_count, lambda msg: msg.extract_bytes()
+        )
+        
+        for _ in range(listener_count):
+            transport.register_listener(uri_provider, 0x8001, listener)
+        publisher.publish_bytes(0x8001, payload)
+        
+        assert all_received.wait(timeout=1.0), "Not all listeners received the message"
+        assert received_payloads == [payload] * listener_count
+
+    def test_register_listener_c(self, transport, uri_provider, collector):
+        """Test registering a native callback by function pointer"""
+        publisher = SimplePublisher(transport, uri_provider)
+        record, received_payloads, message_received = collector(extract=lambda item: item)
+        
+        @NATIVE_CALLBACK
+        def on_payload(data, length, user_data):
+            record((ctypes.string_at(data, length), user_data))
+        
+        fn_ptr = ctypes.cast(on_payload, ctypes.c_void_p).value
+        handle = transport.register_listener_c(uri_provider, 0x8001, fn_ptr, 42)
+        
+        publisher.publish(0x8001, UPayload.from_bytes(b"Hi"))
+        
+        assert message_received.wait(timeout=1.0), "Message was not received"
+        assert received_payloads == [(b"Hi", 42)]
+        
+        # on_payload must outlive the registration
+        transport.unregister_listener(handle)
+
+    def test_register_listener_c_null_pointer(self, transport, uri_provider):
+        """Test that a null function pointer is rejected"""
+        with pytest.raises(Exception):
+            transport.register_listener_c(uri_provider, 0x8001, 0)
+
+    def test_unregister_listener(self, transport, uri_provider):
+        """Test unregistering a listener by its handle"""
+        publisher = SimplePublisher(transport, uri_provider)
+        
+        received_messages = []
         
+        def listener(msg):
+            received_messages.append(msg.extract_string())
+        
+        handle = transport.register_listener(uri_provider, 0x8001, listener)
+        assert isinstance(handle, ListenerHandle)
+        
+        transport.unregister_listener(handle)
+        publisher.publish(0x8001, UPayload.from_string("Hello"))
+        
+        assert received_messages == []
+
+    def test_unregister_listener_unknown_handle(self, transport, uri_provider):
+        """Test that a handle can only be unregistered once"""
+        handle = transport.register_listener(uri_provider, 0x8001, lambda msg: None)
+        transport.unregister_listener(handle)
+        
+        with pytest.raises(Exception):
+            transport.unregister_listener(handle)
+
+    def test_unregister_listener_foreign_handle(self, transport, uri_provider):
+        """Test that a handle from another transport is rejected"""
+        other = LocalTransport()
+        handle = transport.register_listener(uri_provider, 0x8001, lambda msg: None)
+        other_handle = other.register_listener(uri_provider, 0x8001, lambda msg: None)
+        assert handle != other_handle
+        
+        with pytest.raises(Exception):
+            other.unregister_listener(handle)
+        # Both registrations are still in place
+        transport.unregister_listener(handle)
+        other.unregister_listener(other_handle)
+
+    def test_register_same_callback_twice(self, transport, uri_provider):
+        """Test that each registration of one callback gets its own handle"""
         def listener(msg):
             pass
         
-        transport.register_listener(provider, 0x8001, listener)
-        # Note: unregister may not work due to Arc comparison issues
-        # Just test it doesn't crash
-        try:
-            transport.unregister_listener(provider, 0x8001, listener)
-        except Exception:
-            pass  # Expected to potentially fail
+        first = transport.register_listener(uri_provider, 0x8001, listener)
+        second = transport.register_listener(uri_provider, 0x8002, listener)
+        
+        assert first != second
+        transport.unregister_listener(first)
+        transport.unregister_listener(second)
+
+    def test_unregister_listener_by_callback_is_deprecated(self, transport, uri_provider):
+        """Test the deprecated provider/resource/callback form of unregister_listener"""
+        def listener(msg):
+            pass
+        
+        transport.register_listener(uri_provider, 0x8001, listener)
+        
+        with pytest.warns(DeprecationWarning):
+            transport.unregister_listener(uri_provider, 0x8001, listener)
 
 
 def test_version():
@@ -160,5 +559,37 @@ def test_version():
     assert up_py_rs.__version__ is not None
 
 
+def test_shim_module_attributes():
+    """Test that the shim modules resolve their classes lazily and cache them"""
+    import up_py_rs.communication as communication
+
+    assert communication.UPayload is UPayload
+    assert "UPayload" in vars(communication)
+    with pytest.raises(AttributeError):
+        communication.NotAClass
+
+
+def test_shim_reexports_native_classes():
+    """Test that the shim modules hand out the native classes, not Python wrappers"""
+    import up_py_rs.communication
+    import up_py_rs.local_transport
+    from up_py_rs import up_py_rs as native
+
+    assert up_py_rs.communication.SimplePublisher is native.communication.SimplePublisher
+    for name in up_py_rs.communication.__all__:
+        assert getattr(up_py_rs.communication, name) is getattr(native.communication, name)
+    for name in up_py_rs.local_transport.__all__:
+        assert getattr(up_py_rs.local_transport, name) is getattr(native.local_transport, name)
+
+
+def test_package_reexports():
+    """Test that the package re-exports the submodule classes unchanged"""
+    import up_py_rs
+
+    assert up_py_rs.SimplePublisher is SimplePublisher
+    assert up_py_rs.UPayloadBuilder is UPayloadBuilder
+    assert up_py_rs.LocalTransport is LocalTransport
+
+
 if __name__ == '__main__':
     pytest.main([__file__, "-v"])
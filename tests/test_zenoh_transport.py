@@ -1,7 +1,9 @@
 """Tests for Zenoh transport functionality"""
 
-import pytest
+import socket
 import time
+
+import pytest
 from threading import Thread, Event
 
 from up_py_rs import StaticUriProvider
@@ -15,6 +17,47 @@ except (ImportError, AttributeError):
     pytest.skip("Zenoh transport not available", allow_module_level=True)
 
 
+def free_endpoint():
+    """Return a loopback TCP endpoint on a currently unused port.
+
+    Pub/sub tests connect their sessions through explicit endpoints instead of
+    multicast scouting, which is unavailable in many containers and CI runners.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"tcp/127.0.0.1:{sock.getsockname()[1]}"
+
+
+READY_PROBE = "ready?"
+
+
+def wait_until_routed(publisher, resource_id, ready, timeout=5.0):
+    """Publish probe messages until the subscriber has seen one.
+
+    A returning ``register_listener`` only means the subscriber was declared
+    locally; the remote session may not have learned about it yet. A probe
+    arriving at the listener is the actual signal that messages get through.
+    """
+    probe = UPayload.from_string(READY_PROBE)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        publisher.publish(resource_id, probe)
+        if ready.wait(timeout=0.05):
+            return True
+    return False
+
+
+def skip_probes(ready):
+    """Return a collector ``extract`` that sets ``ready`` on probes and drops them."""
+    def extract(msg):
+        text = msg.extract_string()
+        if text == READY_PROBE:
+            ready.set()
+            return None
+        return text
+    return extract
+
+
 class TestZenohTransport:
     """Tests for UPTransportZenoh"""
 
@@ -51,7 +94,7 @@ class TestZenohTransport:
         uri_provider = StaticUriProvider("test-vehicle", 0xa34b, 0x01)
         publisher = SimplePublisher(transport, uri_provider)
         
-        payload = UPayload.from_bytes([0x48, 0x65, 0x6c, 0x6c, 0x6f])  # "Hello"
+        payload = UPayload.from_bytes(b"Hello")
         resource_id = 0x8001
         
         # Should not raise an exception
@@ -86,37 +129,31 @@ class TestZenohTransport:
         # Should not raise an exception
         transport.register_listener(source_uri, listener)
 
-    def test_zenoh_pubsub_integration(self):
+    def test_zenoh_pubsub_integration(self, collector):
         """Test full publish-subscribe flow with Zenoh"""
         authority = "test-vehicle"
         entity_id = 0xa34b
         version = 0x01
         resource_id = 0x8001
         
+        endpoint = free_endpoint()
+        
         # Create subscriber first
-        sub_transport = UPTransportZenoh.builder(authority).build()
+        sub_transport = UPTransportZenoh.builder(authority).listen(endpoint).build()
         sub_uri_provider = StaticUriProvider(authority, entity_id, version)
         
-        received_messages = []
-        message_received = Event()
-        
-        def listener(msg):
-            text = msg.extract_string()
-            if text:
-                received_messages.append(text)
-                message_received.set()
+        ready = Event()
+        listener, received_messages, message_received = collector(extract=skip_probes(ready))
         
         # Register listener
         source_uri = sub_uri_provider.get_resource_uri(resource_id)
         sub_transport.register_listener(source_uri, listener)
         
-        # Give time for listener to be ready
-        time.sleep(0.5)
-        
-        # Create publisher
-        pub_transport = UPTransportZenoh.builder(authority).build()
+        # Create publisher, connected straight to the subscriber
+        pub_transport = UPTransportZenoh.builder(authority).connect(endpoint).build()
         pub_uri_provider = StaticUriProvider(authority, entity_id, version)
         publisher = SimplePublisher(pub_transport, pub_uri_provider)
+        assert wait_until_routed(publisher, resource_id, ready), "Subscriber never became reachable"
         
         # Publish message
         test_message = "Integration test message"
@@ -126,12 +163,51 @@ class TestZenohTransport:
         # Wait for message (with timeout)
         received = message_received.wait(timeout=2.0)
         
-        # Note: This test may fail if Zenoh networking isn't properly set up
-        # It's more of an integration test than a unit test
-        if received:
-            assert test_message in received_messages
-        else:
-            pytest.skip("Message not received (Zenoh networking may not be configured)")
+        # The sessions are connected through an explicit endpoint, so no router or scouting is needed
+        assert received, "Message was not received"
+        assert test_message in received_messages
+
+
+    def test_zenoh_pubsub_threaded(self, collector):
+        """Test a subscriber thread receiving a burst of messages in-process"""
+        authority = "test-vehicle"
+        entity_id = 0xa34b
+        version = 0x01
+        resource_id = 0x8002
+        message_count = 5
+        endpoint = free_endpoint()
+        
+        subscribed = Event()
+        ready = Event()
+        listener, received_messages, all_received = collector(message_count, skip_probes(ready))
+        
+        def run_subscriber_until_event():
+            sub_transport = UPTransportZenoh.builder(authority).listen(endpoint).build()
+            sub_uri_provider = StaticUriProvider(authority, entity_id, version)
+            source_uri = sub_uri_provider.get_resource_uri(resource_id)
+            handle = sub_transport.register_listener(source_uri, listener)
+            subscribed.set()
+            all_received.wait(timeout=10.0)
+            sub_transport.unregister_listener(handle)
+        
+        subscriber = Thread(target=run_subscriber_until_event)
+        subscriber.start()
+        assert subscribed.wait(timeout=2.0), "Subscriber did not start"
+        
+        pub_transport = UPTransportZenoh.builder(authority).connect(endpoint).build()
+        pub_uri_provider = StaticUriProvider(authority, entity_id, version)
+        publisher = SimplePublisher(pub_transport, pub_uri_provider)
+        assert wait_until_routed(publisher, resource_id, ready), "Subscriber never became reachable"
+        publisher.publish_many(
+            resource_id,
+            [UPayload.from_string(f"Message {i}") for i in range(message_count)],
+        )
+        
+        received = all_received.wait(timeout=2.0)
+        subscriber.join()
+        
+        assert received, "Not all messages were received"
+        assert received_messages == [f"Message {i}" for i in range(message_count)]
 
 
 class TestZenohBuilder:
@@ -145,6 +221,36 @@ class TestZenohBuilder:
         transport = builder.build()
         assert transport is not None
 
+    def test_builder_modes(self):
+        """Test selecting the Zenoh session mode"""
+        transport = UPTransportZenoh.builder("test-authority").mode("peer").build()
+        assert transport is not None
+        
+        with pytest.raises(Exception):
+            UPTransportZenoh.builder("test-authority").mode("broker")
+
+    def test_builder_endpoints(self):
+        """Test configuring explicit listen and connect endpoints"""
+        endpoint = free_endpoint()
+        server = UPTransportZenoh.builder("test-authority").listen(endpoint).build()
+        assert server is not None
+        
+        transport = UPTransportZenoh.builder("test-authority").connect(endpoint).build()
+        assert transport is not None
+
+    def test_builder_without_batching(self):
+        """Test building a Zenoh transport with batching disabled"""
+        transport = UPTransportZenoh.builder("test-authority").batching(False).build()
+        assert transport is not None
+
+    def test_shim_reexports_native_classes(self):
+        """Test that the zenoh_transport shim hands out the native classes"""
+        import up_py_rs.zenoh_transport as shim
+        from up_py_rs import up_py_rs as native
+
+        for name in shim.__all__:
+            assert getattr(shim, name) is getattr(native.zenoh_transport, name)
+
 
 if __name__ == '__main__':
     pytest.main([__file__, "-v"])
@@ -1 +1,11 @@
+from . import up_py_rs as _native
 from .up_py_rs import *
+from .up_py_rs.communication import SimplePublisher, SimpleNotifier, UPayload, UPayloadBuilder
+from .up_py_rs.local_transport import LocalTransport
+from ._uri_cache import CachedUriProvider, cached_uri_provider
+
+# Only present in builds with zenoh support; up_py_rs.zenoh_transport explains otherwise
+if hasattr(_native, "zenoh_transport"):
+    from .up_py_rs.zenoh_transport import UPTransportZenoh, UPTransportZenohBuilder
+
+del _native
@@ -1,10 +1,25 @@
-from typing import Optional
+from typing import Callable, Optional
 
 class UUri:
     """
     UUri Class
+    
+    ``str()`` returns the URI in its string form. The string is built on the
+    first call and the same object is returned afterwards.
     """
-    ...
+    
+    def __str__(self) -> str:
+        """
+        Return the URI in its string form.
+        
+        Example:
+            >>> topic = provider.get_resource_uri(0xd100)
+            >>> str(topic)
+            '//my-vehicle/A34B/1/D100'
+        """
+        ...
+    
+    def __repr__(self) -> str: ...
 
 class StaticUriProvider:
     """
@@ -39,7 +54,8 @@ class StaticUriProvider:
             resource_id: The resource ID (0 to 65535).
         
         Returns:
-            The resource URI.
+            The resource URI. Repeated calls with the same resource ID
+            return the same object.
         
         Example:
             >>> topic = provider.get_resource_uri(0xd100)
@@ -70,6 +86,10 @@ class UMessage:
         """
         Extract string value from the message payload.
         
+        Both payloads created with ``UPayload.from_string`` and plain text
+        payloads created with ``UPayload.from_text`` are supported. Text payloads
+        are turned into a ``str`` straight from the payload bytes.
+        
         Returns:
             The extracted string if successful, None if the message
             doesn't contain a string value.
@@ -80,5 +100,125 @@ class UMessage:
             ...     print(f"Received: {text}")
         """
         ...
+    
+    def extract_bytes(self) -> Optional[bytes]:
+        """
+        Extract the raw payload bytes of the message.
+        
+        Returns:
+            The payload exactly as carried on the wire, or None if the
+            message has no payload.
+        
+        Example:
+            >>> data = message.extract_bytes()
+            >>> if data is not None:
+            ...     print(f"Received {len(data)} bytes")
+        """
+        ...
+
+class CachedUriProvider:
+    """
+    Wraps a StaticUriProvider and memoizes its URI lookups in Python.
+    
+    Repeated calls return the cached UUri without crossing into the extension.
+    StaticUriProvider already returns cached UUri objects itself, so this only
+    saves the extension call and its cache lock; prefer the plain provider
+    unless URI lookups show up in a profile. Transports, publishers and
+    notifiers only accept the wrapped provider, available as ``provider``.
+    """
+    
+    provider: StaticUriProvider
+    
+    def __init__(self, provider: StaticUriProvider) -> None: ...
+    
+    def get_resource_uri(self, resource_id: int) -> UUri:
+        """Return the resource URI, cached for the 128 most recent resource IDs."""
+        ...
+    
+    def get_source_uri(self) -> UUri:
+        """Return the source URI, cached after the first call."""
+        ...
+
+def cached_uri_provider(provider: StaticUriProvider) -> CachedUriProvider:
+    """
+    Wrap a StaticUriProvider so that its URI lookups are memoized.
+    
+    Args:
+        provider: The provider to wrap.
+    
+    Returns:
+        A wrapper exposing ``get_resource_uri``, ``get_source_uri`` and the
+        wrapped ``provider``.
+    
+    Example:
+        >>> from up_py_rs import StaticUriProvider, cached_uri_provider
+        >>> uri_provider = cached_uri_provider(StaticUriProvider("my-vehicle", 0xa34b, 0x01))
+        >>> topic = uri_provider.get_resource_uri(0xd100)
+        >>> notifier = SimpleNotifier(transport, uri_provider.provider)
+    """
+    ...
+
+class ListenerHandle:
+    """
+    Opaque token identifying one listener registration.
+    
+    Returned by ``register_listener``, ``register_listener_c`` and
+    ``SimpleNotifier.start_listening``, and passed back to the matching
+    unregister method to remove exactly that registration. Handles are unique
+    within the process; passing one to a different transport or notifier raises.
+    
+    Example:
+        >>> handle = transport.register_listener(uri_provider, 0xb4c1, my_handler)
+        >>> transport.unregister_listener(handle)
+    """
+    
+    def __eq__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
+
+class StringListener:
+    """
+    Wraps a callback that only needs the text of each message.
+    
+    Pass a StringListener anywhere a listener callback is accepted. The
+    extension then decodes string payloads itself and calls the wrapped
+    function with a ``str``, skipping the UMessage object and the
+    ``extract_string()`` call on every delivery. Messages that don't carry a
+    string payload are not delivered.
+    """
+    
+    def __init__(self, callback: Callable[[str], None]) -> None:
+        """
+        Create a new StringListener.
+        
+        Args:
+            callback: A Python function that accepts a str parameter.
+        
+        Example:
+            >>> from up_py_rs import StringListener
+            >>> listener = StringListener(lambda text: print(text))
+            >>> transport.register_listener(uri_provider, 0xb4c1, listener)
+        """
+        ...
+    
+    def __call__(self, msg: UMessage) -> None:
+        """
+        Deliver a message by hand, as the extension does for registered listeners.
+        """
+        ...
 
 __version__: str
+
+
+# Native classes re-exported from the submodules so hot code can import them
+# from the package directly. The Zenoh classes exist only in builds with zenoh support.
+from .communication import (
+    SimpleNotifier as SimpleNotifier,
+    SimplePublisher as SimplePublisher,
+    UPayload as UPayload,
+    UPayloadBuilder as UPayloadBuilder,
+)
+from .local_transport import LocalTransport as LocalTransport
+from .zenoh_transport import (
+    UPTransportZenoh as UPTransportZenoh,
+    UPTransportZenohBuilder as UPTransportZenohBuilder,
+)
@@ -0,0 +1,33 @@
+"""Python-side memoization of URI lookups"""
+
+from functools import lru_cache
+
+
+class CachedUriProvider:
+    """
+    Wraps a StaticUriProvider and memoizes its URI lookups in Python.
+
+    Repeated calls return the cached UUri without crossing into the extension.
+    StaticUriProvider already returns cached UUri objects itself, so this only
+    saves the extension call and its cache lock; prefer the plain provider
+    unless URI lookups show up in a profile. Transports, publishers and
+    notifiers only accept the wrapped provider, available as ``provider``.
+    """
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.get_resource_uri = lru_cache(maxsize=128)(provider.get_resource_uri)
+        # functools.cache needs Python 3.9; an unbounded lru_cache is the same thing
+        self.get_source_uri = lru_cache(maxsize=None)(provider.get_source_uri)
+
+
+def cached_uri_provider(provider):
+    """
+    Wrap a StaticUriProvider so that its URI lookups are memoized.
+
+    Example:
+        >>> uri_provider = cached_uri_provider(StaticUriProvider("my-vehicle", 0xa34b, 0x01))
+        >>> topic = uri_provider.get_resource_uri(0xd100)
+        >>> notifier = SimpleNotifier(transport, uri_provider.provider)
+    """
+    return CachedUriProvider(provider)
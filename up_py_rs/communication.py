@@ -1,7 +1,15 @@
-from up_py_rs import communication as _communication
+# HOT PATH: must remain a zero-cost re-export; do not wrap methods in Python.
+# Publish and listener calls go straight to the native classes; see test_shim_reexports_native_classes.
 
-SimplePublisher = _communication.SimplePublisher
-SimpleNotifier = _communication.SimpleNotifier
-UPayload = _communication.UPayload
+__all__ = ['SimplePublisher', 'SimpleNotifier', 'UPayload', 'UPayloadBuilder']
 
-__all__ = ['SimplePublisher', 'SimpleNotifier', 'UPayload']
+
+def __getattr__(name):
+    # PEP 562: resolve the native classes on first use and cache them in the module dict
+    if name in __all__:
+        from .up_py_rs import communication as _native
+
+        value = getattr(_native, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,5 @@
-from typing import Optional, Callable
-from . import StaticUriProvider, UUri, UMessage
+from typing import Any, Optional, Callable, Iterable, Union
+from . import ListenerHandle, StaticUriProvider, UUri, UMessage
 from .local_transport import LocalTransport
 from .zenoh_transport import UPTransportZenoh
 
@@ -33,21 +33,190 @@ class UPayload:
         ...
     
     @staticmethod
-    def from_bytes(data: list[int]) -> 'UPayload':
+    def from_text(value: str) -> 'UPayload':
+        """
+        Create a plain-text UPayload from a string value.
+        
+        The string is carried as UTF-8 bytes with format UPAYLOAD_FORMAT_TEXT,
+        without the protobuf envelope used by ``from_string``. Receivers read it
+        with ``extract_string()`` without any protobuf decoding. Use
+        ``from_string`` when the receiving side expects a protobuf StringValue.
+        
+        Args:
+            value: The text to carry in the payload.
+        
+        Returns:
+            A new payload instance containing the text.
+        
+        Example:
+            >>> from up_py_rs.communication import UPayload
+            >>> payload = UPayload.from_text("Hello, World!")
+        """
+        ...
+    
+    @staticmethod
+    def from_bytes(data: Union[bytes, bytearray, memoryview, list[int]]) -> 'UPayload':
         """
         Create a UPayload from raw bytes.
         
         Args:
-            data: A list of bytes (0-255) to wrap in the payload.
+            data: The binary data to wrap in the payload. A ``bytes`` object is
+                  shared without copying, a bytearray or memoryview is copied
+                  in a single block, and a list of ints (0-255) is still
+                  accepted but converted item by item. Wrap other buffer
+                  exporters (``array.array``, numpy arrays) in a ``memoryview`` first.
+        
+        Returns:
+            A new payload instance with format UPAYLOAD_FORMAT_RAW, the same
+            format ``SimplePublisher.publish_bytes`` sends.
+        
+        Raises:
+            TypeError: If data is not bytes, bytearray, memoryview or a list.
+            Exception: If a list item is not an int in range 0-255.
+        
+        Example:
+            >>> from up_py_rs.communication import UPayload
+            >>> payload = UPayload.from_bytes(b"Hello")
+        """
+        ...
+    
+    @staticmethod
+    def from_u32(value: int) -> 'UPayload':
+        """
+        Create a raw UPayload holding an unsigned 32-bit integer.
+        
+        The value is written as 4 little-endian bytes, with no string formatting
+        involved. Receivers read it back with
+        ``struct.unpack("<I", msg.extract_bytes())``.
+        
+        Args:
+            value: The integer to send (0 to 2^32-1).
+        
+        Returns:
+            A new payload instance with format UPAYLOAD_FORMAT_RAW.
+        
+        Example:
+            >>> from up_py_rs.communication import UPayload
+            >>> payload = UPayload.from_u32(42)
+        """
+        ...
+    
+    @staticmethod
+    def from_f64(value: float) -> 'UPayload':
+        """
+        Create a raw UPayload holding a 64-bit float.
+        
+        The value is written as 8 little-endian bytes. Receivers read it back
+        with ``struct.unpack("<d", msg.extract_bytes())``.
+        
+        Args:
+            value: The number to send.
+        
+        Returns:
+            A new payload instance with format UPAYLOAD_FORMAT_RAW.
+        
+        Example:
+            >>> from up_py_rs.communication import UPayload
+            >>> payload = UPayload.from_f64(21.5)
+        """
+        ...
+    
+    @staticmethod
+    def from_struct(fmt: str, *args: Any) -> 'UPayload':
+        """
+        Create a raw UPayload by packing values according to a format string.
+        
+        The format follows the ``struct`` module: a byte order prefix (``<``
+        little-endian, ``>`` or ``!`` big-endian, ``=`` native) followed by
+        format characters, each optionally preceded by a repeat count. Values
+        use standard sizes with no alignment padding, so the bytes match
+        ``struct.pack`` with the same format. Supported characters are
+        ``x b B ? h H i I l L q Q f d s``. The prefix is required: ``struct``'s
+        default native ``@`` layout adds alignment padding and is not supported.
+        
+        Args:
+            fmt: The format string.
+            *args: The values to pack, one per format character (``x`` takes none).
         
         Returns:
-            A new payload instance containing the binary data.
+            A new payload instance with format UPAYLOAD_FORMAT_RAW.
+        
+        Raises:
+            Exception: If the format has no byte order prefix, is invalid, or
+                does not match the arguments.
         
         Example:
             >>> from up_py_rs.communication import UPayload
-            >>> payload = UPayload.from_bytes([72, 101, 108, 108, 111])
+            >>> payload = UPayload.from_struct("<Id", 7, 21.5)
+        """
+        ...
+
+class UPayloadBuilder:
+    """
+    Reusable buffer for building raw payloads.
+    
+    UPayloadBuilder keeps one growable buffer across messages. Each call to
+    ``finish()`` hands the written bytes to a new UPayload without copying and
+    leaves the builder empty, ready for the next message.
+    """
+    
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Create a new UPayloadBuilder.
+        
+        Args:
+            capacity: Initial buffer size in bytes.
+        
+        Example:
+            >>> from up_py_rs.communication import UPayloadBuilder
+            >>> builder = UPayloadBuilder(64)
+        """
+        ...
+    
+    def reset(self) -> None:
+        """Discard anything written since the last ``finish()``."""
+        ...
+    
+    def write_str(self, value: str) -> None:
+        """
+        Append the UTF-8 encoding of a string.
+        
+        Args:
+            value: The text to append.
+        """
+        ...
+    
+    def write_bytes(self, data: Union[bytes, bytearray, memoryview, list[int]]) -> None:
+        """
+        Append raw bytes.
+        
+        Args:
+            data: The bytes to append. Accepts the same types as
+                  ``UPayload.from_bytes``.
+        """
+        ...
+    
+    def finish(self) -> UPayload:
+        """
+        Turn the written bytes into a UPayload and empty the builder.
+        
+        If only ``write_str`` was used, the payload has format UPAYLOAD_FORMAT_TEXT,
+        like one created with ``UPayload.from_text``, so ``UMessage.extract_string()``
+        and ``StringListener`` see the text. Once ``write_bytes`` has been called
+        the payload has format UPAYLOAD_FORMAT_RAW.
+        
+        Returns:
+            A payload holding the bytes written since the last ``finish()``.
+        
+        Example:
+            >>> builder = UPayloadBuilder(64)
+            >>> for i in range(5):
+            ...     builder.write_str(f"msg {i}")
+            ...     publisher.publish(0xb4c1, builder.finish())
         """
         ...
+    
+    def __len__(self) -> int: ...
 
 class SimplePublisher:
     """
@@ -78,16 +247,25 @@ class SimplePublisher:
         """
         ...
     
-    def publish(self, resource_id: int, payload: Optional['UPayload']) -> None:
+    def publish(
+        self,
+        resource_id: int,
+        payload: Optional['UPayload'],
+        priority: Optional[str] = None,
+    ) -> None:
         """
         Publish a message to a specific resource.
         
         Args:
             resource_id: The target resource ID (0 to 65535).
             payload: The message payload, or None for empty messages.
+            priority: Optional message priority, one of "Background", "DataLow",
+                "Data", "DataHigh", "InteractiveLow", "InteractiveHigh" or
+                "RealTime" ("CS0" to "CS6" are accepted too). Defaults to the
+                transport's default priority.
         
         Raises:
-            Exception: If publishing fails.
+            Exception: If the priority is unknown or publishing fails.
         
         Example:
             >>> from up_py_rs.communication import UPayload
@@ -95,6 +273,123 @@ class SimplePublisher:
             >>> publisher.publish(0xb4c1, payload)
             >>> # Or publish without payload:
             >>> publisher.publish(0xb4c1, None)
+            >>> # Latency-sensitive messages can raise their priority:
+            >>> publisher.publish(0xb4c1, payload, priority="RealTime")
+        """
+        ...
+
+    def publish_bytes(
+        self,
+        resource_id: int,
+        data: Union[bytes, bytearray, memoryview],
+        priority: Optional[str] = None,
+    ) -> None:
+        """
+        Publish raw bytes to a specific resource.
+
+        The bytes are sent as a UPAYLOAD_FORMAT_RAW payload without creating an
+        intermediate UPayload object.
+
+        Args:
+            resource_id: The target resource ID (0 to 65535).
+            data: The payload bytes.
+            priority: Optional message priority, using the same names as ``publish``.
+
+        Raises:
+            TypeError: If data is not bytes-like.
+            Exception: If the priority is unknown or publishing fails.
+
+        Example:
+            >>> publisher.publish_bytes(0xb4c1, b"Hello")
+        """
+        ...
+
+    def publish_many(
+        self,
+        resource_id: int,
+        payloads: Iterable[Optional['UPayload']],
+        priority: Optional[str] = None,
+    ) -> None:
+        """
+        Publish several messages to the same resource in a single call.
+
+        All payloads are sent in order without returning to Python between
+        messages, so consecutive messages can share a transport batch.
+
+        Args:
+            resource_id: The target resource ID (0 to 65535).
+            payloads: The payloads to publish, in order. Any iterable works,
+                including generators; it is consumed before the first
+                message is sent.
+            priority: Optional message priority, using the same names as
+                ``publish``. Applies to every message in the call.
+
+        Raises:
+            Exception: If the priority is unknown, or if publishing any of the
+                      messages fails. Messages before the failing one have
+                      already been sent.
+
+        Example:
+            >>> from up_py_rs.communication import UPayload
+            >>> payloads = [UPayload.from_string(f"Hello #{i}") for i in range(5)]
+            >>> publisher.publish_many(0xb4c1, payloads)
+        """
+        ...
+
+    def publish_batch(
+        self,
+        messages: list[tuple[int, Optional['UPayload']]],
+        priority: Optional[str] = None,
+    ) -> None:
+        """
+        Publish a batch of messages, each to its own resource, in a single call.
+
+        Args:
+            messages: The ``(resource_id, payload)`` pairs to publish, in order.
+            priority: Optional message priority, using the same names as
+                ``publish``. Applies to every message in the call.
+
+        Raises:
+            Exception: If the priority is unknown, or if publishing any of the
+                      messages fails. Messages before the failing one have
+                      already been sent.
+
+        Example:
+            >>> from up_py_rs.communication import UPayload
+            >>> publisher.publish_batch([
+            ...     (0xb4c1, UPayload.from_string("speed")),
+            ...     (0xb4c2, UPayload.from_string("heading")),
+            ... ])
+        """
+        ...
+
+    def publish_to_all(
+        self,
+        resource_ids: list[int],
+        payload: Optional['UPayload'],
+        priority: Optional[str] = None,
+    ) -> None:
+        """
+        Publish the same payload to several resources in a single call.
+
+        The payload is built once and shared by every message; only a
+        reference to its buffer is copied per resource.
+
+        Args:
+            resource_ids: The target resource IDs (0 to 65535), in order.
+            payload: The payload to publish to each of them.
+            priority: Optional message priority, using the same names as
+                ``publish``. Applies to every message in the call.
+
+        Raises:
+            Exception: If the priority is unknown, or if publishing any of the
+                      messages fails. Messages before the failing one have
+                      already been sent.
+
+        Example:
+            >>> from up_py_rs.communication import UPayload
+            >>> payload = UPayload.from_string("shutdown")
+            >>> publisher.publish_to_all([0xb4c1, 0xb4c2, 0xb4c3], payload)
         """
         ...
 
@@ -126,15 +421,21 @@ class SimpleNotifier:
         """
         ...
 
-    def start_listening(self, topic: UUri, callback: Callable[[UMessage], None]) -> None:
+    def start_listening(self, topic: UUri, callback: Callable[[UMessage], None]) -> ListenerHandle:
         """
         Start listening for notifications on a specific topic.
         
+        The listener is in place when this method returns, so notifications sent
+        afterwards are delivered to it without any further wait.
+        
         Args:
             topic: The topic URI to listen to.
             callback: A Python function that accepts a UMessage parameter.
                      Will be called when notifications arrive.
         
+        Returns:
+            Token to pass to ``stop_listening``.
+        
         Raises:
             Exception: If listener registration fails.
         
@@ -145,27 +446,36 @@ class SimpleNotifier:
             ...     if text:
             ...         print(f"Notification: {text}")
             >>> topic = uri_provider.get_resource_uri(0xd100)
-            >>> notifier.start_listening(topic, notification_handler)
+            >>> handle = notifier.start_listening(topic, notification_handler)
         """
         ...
     
-    def stop_listening(self, topic: UUri, callback: Callable[[UMessage], None]) -> None:
+    def stop_listening(self, handle: ListenerHandle) -> None:
         """
-        Stop listening for notifications on a specific topic.
+        Stop listening for notifications.
         
         Args:
-            topic: The topic URI to stop listening to.
-            callback: The same Python function that was registered.
+            handle: The handle returned by ``start_listening``.
         
         Raises:
-            Exception: If listener unregistration fails.
+            Exception: If the handle is unknown or listener unregistration fails.
         
         Example:
-            >>> notifier.stop_listening(topic, notification_handler)
+            >>> notifier.stop_listening(handle)
+        
+        Note:
+            The older form ``stop_listening(topic, callback)`` is still accepted
+            but deprecated; it emits a DeprecationWarning.
         """
         ...
     
-    def notify(self, resource_id: int, destination: UUri, payload: Optional[UPayload]) -> None:
+    def notify(
+        self,
+        resource_id: int,
+        destination: UUri,
+        payload: Optional[UPayload],
+        priority: Optional[str] = None,
+    ) -> None:
         """
         Send a notification to a specific destination.
         
@@ -173,14 +483,17 @@ class SimpleNotifier:
             resource_id: The notification resource ID (0 to 65535).
             destination: The destination URI to send the notification to.
             payload: The notification payload, or None for empty notifications.
+            priority: Optional message priority, using the same names as
+                SimplePublisher.publish. Defaults to the transport's default priority.
         
         Raises:
-            Exception: If notification sending fails.
+            Exception: If the priority is unknown or notification sending fails.
         
         Example:
             >>> from up_py_rs.communication import UPayload
             >>> payload = UPayload.from_string("Alert!")
             >>> destination = uri_provider.get_source_uri()
             >>> notifier.notify(0xd100, destination, payload)
+            >>> notifier.notify(0xd100, destination, payload, priority="RealTime")
         """
         ...
\ No newline at end of file
@@ -1,4 +1,4 @@
-from . import StaticUriProvider, UMessage
+from . import ListenerHandle, StaticUriProvider, UMessage
 
 from typing import Callable
 
@@ -9,6 +9,11 @@ class LocalTransport:
     LocalTransport enables communication between components within the same
     process without network overhead. It manages listener registration and
     message routing.
+    
+    When several listeners match a message, they all share one payload buffer;
+    handing the message to each listener only bumps a reference count. Nothing
+    is copied until a listener asks for the payload: each ``extract_bytes()``
+    or ``extract_string()`` call then makes its own copy.
     """
     
     def __init__(self) -> None:
@@ -29,16 +34,22 @@ class LocalTransport:
         uri_provider: StaticUriProvider,
         resource_id: int,
         callback: Callable[[UMessage], None]
-    ) -> None:
+    ) -> ListenerHandle:
         """
         Register a listener callback for a specific resource.
         
+        The listener is in place when this method returns, so messages published
+        afterwards are delivered to it without any further wait.
+        
         Args:
             uri_provider: The URI provider identifying the entity.
             resource_id: The resource ID to listen to (0 to 65535).
             callback: A Python function that accepts a UMessage parameter.
                         Will be called when messages arrive.
         
+        Returns:
+            Token to pass to ``unregister_listener``.
+        
         Raises:
             Exception: If registration fails.
         
@@ -46,29 +57,70 @@ class LocalTransport:
             >>> from up_py_rs import UMessage
             >>> def my_handler(msg: UMessage):
             ...     print(msg.extract_string())
-            >>> transport.register_listener(uri_provider, 0xb4c1, my_handler)
+            >>> handle = transport.register_listener(uri_provider, 0xb4c1, my_handler)
         """
         ...
     
-    def unregister_listener(
+    def register_listener_c(
         self,
         uri_provider: StaticUriProvider,
         resource_id: int,
-        callback: Callable[[UMessage], None]
-    ) -> None:
+        fn_ptr: int,
+        user_data: int = 0
+    ) -> ListenerHandle:
+        """
+        Register a native (C ABI) callback for a specific resource.
+        
+        The callback is invoked directly from the delivering thread without
+        acquiring the GIL, so no Python code runs per message unless the
+        callback itself calls back into Python.
+        
+        Only the raw address is stored. The function, and whatever ``user_data``
+        points to, must stay valid until ``unregister_listener`` returns. For a
+        ``ctypes.CFUNCTYPE`` callback, keep a reference to the CFUNCTYPE object
+        until then: once it is garbage collected the stored pointer dangles and
+        the next message calls freed memory.
+        
+        Args:
+            uri_provider: The URI provider identifying the entity.
+            resource_id: The resource ID to listen to (0 to 65535).
+            fn_ptr: Address of a function with the C signature
+                    ``void callback(const uint8_t *payload, size_t len, void *user_data)``.
+                    The payload pointer is only valid during the call.
+            user_data: Opaque pointer passed back to the callback.
+        
+        Returns:
+            Token to pass to ``unregister_listener``.
+        
+        Raises:
+            Exception: If fn_ptr is null or registration fails.
+        
+        Example:
+            >>> import ctypes
+            >>> lib = ctypes.CDLL("./libhandlers.so")
+            >>> fn_ptr = ctypes.cast(lib.on_payload, ctypes.c_void_p).value
+            >>> handle = transport.register_listener_c(uri_provider, 0xb4c1, fn_ptr)
+            >>> transport.unregister_listener(handle)
+        """
+        ...
+    
+    def unregister_listener(self, handle: ListenerHandle) -> None:
         """
         Unregister a previously registered listener.
         
         Args:
-            uri_provider: The URI provider used during registration.
-            resource_id: The resource ID to stop listening to.
-            callback: The same Python function that was registered.
+            handle: The handle returned by ``register_listener`` or
+                    ``register_listener_c``.
         
         Raises:
-            Exception: If unregistration fails or listener not found.
+            Exception: If the handle is unknown or unregistration fails.
+        
+        Example:
+            >>> handle = transport.register_listener(uri_provider, 0xb4c1, my_handler)
+            >>> transport.unregister_listener(handle)
         
         Note:
-            Currently may fail due to listener instance comparison issues.
-            Consider letting listeners be cleaned up automatically.
+            The older form ``unregister_listener(uri_provider, resource_id, callback)``
+            is still accepted but deprecated; it emits a DeprecationWarning.
         """
-        ...
\ No newline at end of file
+        ...
@@ -13,16 +13,28 @@ Example:
     >>> # Use transport.send() to publish messages
 """
 
-try:
-    from up_py_rs import zenoh_transport as _zenoh_transport
-
-    UPTransportZenoh = _zenoh_transport.UPTransportZenoh
-    UPTransportZenohBuilder = _zenoh_transport.UPTransportZenohBuilder
-
-    __all__ = ["UPTransportZenoh", "UPTransportZenohBuilder"]
-except (ImportError, AttributeError) as e:
-    raise ImportError(
-        "Zenoh transport not available. "
-        "The package was not built with zenoh support. "
-        "Please install a version built with zenoh features enabled."
-    ) from e
+# HOT PATH: must remain a zero-cost re-export; do not wrap methods in Python.
+# Publish and listener calls go straight to the native classes; see test_shim_reexports_native_classes.
+
+__all__ = ["UPTransportZenoh", "UPTransportZenohBuilder"]
+
+
+def __getattr__(name):
+    # PEP 562: resolve the native classes on first use and cache them in the module dict.
+    # Zenoh support is checked here, so the installation hint is raised on first use.
+    # AttributeError keeps hasattr()/getattr(..., default) usable for feature probing;
+    # a class cannot also derive from ImportError (instance layout conflict on 3.10+).
+    if name in __all__:
+        try:
+            from .up_py_rs import zenoh_transport as _native
+        except ImportError as e:
+            raise AttributeError(
+                "Zenoh transport not available. "
+                "The package was not built with zenoh support. "
+                "Please install a version built with zenoh features enabled."
+            ) from e
+
+        value = getattr(_native, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 """Type stubs for Zenoh Transport"""
 
 from typing import Callable
-from . import UUri, UMessage
+from . import ListenerHandle, UUri, UMessage
 
 class UPTransportZenoh:
     """Zenoh-based network transport for uProtocol.
@@ -45,43 +45,86 @@ class UPTransportZenoh:
         self,
         source_filter: UUri,
         listener: Callable[[UMessage], None],
-    ) -> None:
+    ) -> ListenerHandle:
         """Register a listener for messages matching the source filter.
         
+        Returns once the Zenoh subscriber has been declared in this session.
+        Publishers in other sessions learn about it asynchronously, so messages
+        they send right after this returns may still be missed.
+        
         Args:
             source_filter: The URI to listen for messages from
             listener: Python callable that receives UMessage objects
             
+        Returns:
+            Token to pass to ``unregister_listener``
+            
         Raises:
             Exception: If registration fails
             
         Example:
             >>> def handle_message(msg):
             ...     print(f"Received: {msg.extract_string()}")
-            >>> transport.register_listener(source_uri, handle_message)
+            >>> handle = transport.register_listener(source_uri, handle_message)
         """
         ...
     
-    def unregister_listener(
+    def register_listener_c(
         self,
         source_filter: UUri,
-        listener: Callable[[UMessage], None],
-    ) -> None:
-        """Unregister a listener for the given source filter.
+        fn_ptr: int,
+        user_data: int = 0,
+    ) -> ListenerHandle:
+        """Register a native (C ABI) callback for messages matching the source filter.
+        
+        The callback is invoked directly from the Zenoh receive thread without
+        acquiring the GIL, so no Python code runs per message unless the
+        callback itself calls back into Python.
+        
+        Only the raw address is stored. The function, and whatever ``user_data``
+        points to, must stay valid until ``unregister_listener`` returns. For a
+        ``ctypes.CFUNCTYPE`` callback, keep a reference to the CFUNCTYPE object
+        until then: once it is garbage collected the stored pointer dangles and
+        the next message calls freed memory.
         
         Args:
-            source_filter: The URI to stop listening to
-            listener: The Python callable that was registered
+            source_filter: The URI to listen for messages from
+            fn_ptr: Address of a function with the C signature
+                    ``void callback(const uint8_t *payload, size_t len, void *user_data)``.
+                    The payload pointer is only valid during the call.
+            user_data: Opaque pointer passed back to the callback
+            
+        Returns:
+            Token to pass to ``unregister_listener``
             
         Raises:
-            Exception: If unregistration fails
+            Exception: If fn_ptr is null or registration fails
+            
+        Example:
+            >>> import ctypes
+            >>> lib = ctypes.CDLL("./libhandlers.so")
+            >>> fn_ptr = ctypes.cast(lib.on_payload, ctypes.c_void_p).value
+            >>> handle = transport.register_listener_c(source_uri, fn_ptr)
+            >>> transport.unregister_listener(handle)
+        """
+        ...
+    
+    def unregister_listener(self, handle: ListenerHandle) -> None:
+        """Unregister a previously registered listener.
+        
+        Args:
+            handle: The ListenerHandle returned by ``register_listener`` or
+                    ``register_listener_c``
+            
+        Raises:
+            Exception: If the handle is unknown or unregistration fails
             
         Note:
-            Due to listener instance comparison issues, this may not work as expected.
-            Consider letting listeners be cleaned up automatically.
+            The older form ``unregister_listener(source_filter, listener)`` is still
+            accepted but deprecated; it emits a DeprecationWarning.
             
         Example:
-            >>> transport.unregister_listener(source_uri, handle_message)
+            >>> transport.unregister_listener(handle)
         """
         ...
 
@@ -91,6 +134,85 @@ class UPTransportZenohBuilder:
     Provides a fluent API for setting up Zenoh transport configuration.
     """
     
+    def batching(self, enabled: bool) -> UPTransportZenohBuilder:
+        """Enable or disable Zenoh's automatic batching of small messages.
+        
+        Batching is enabled by default and packs consecutive messages into one
+        network frame, which raises throughput for bursts of small messages.
+        Disabling it sends every message in its own frame as soon as possible,
+        trading throughput for lower per-message latency.
+        
+        Args:
+            enabled: Whether outgoing messages may be batched
+            
+        Returns:
+            The same builder, for chaining
+            
+        Example:
+            >>> transport = UPTransportZenoh.builder("my-vehicle").batching(False).build()
+        """
+        ...
+    
+    def mode(self, mode: str) -> UPTransportZenohBuilder:
+        """Set the Zenoh session mode.
+        
+        * ``"peer"`` (Zenoh's default) connects directly to other peers. Peers
+          find each other through multicast scouting, or through the
+          endpoints given with ``listen()`` and ``connect()``.
+        * ``"client"`` connects to a Zenoh router, which forwards all traffic.
+          Use it when peers cannot reach each other directly.
+        * ``"router"`` runs a router inside this process.
+        
+        If not set, Zenoh's default mode is used.
+        
+        Args:
+            mode: One of "peer", "client" or "router"
+            
+        Returns:
+            The same builder, for chaining
+            
+        Raises:
+            Exception: If the mode is not one of the above
+            
+        Example:
+            >>> transport = UPTransportZenoh.builder("my-vehicle").mode("peer").build()
+        """
+        ...
+    
+    def listen(self, endpoint: str) -> UPTransportZenohBuilder:
+        """Add an endpoint this session listens on for incoming connections.
+        
+        Together with ``connect()`` this lets sessions reach each other without
+        multicast scouting, which is often unavailable in containers and CI.
+        May be called more than once.
+        
+        Args:
+            endpoint: A Zenoh locator such as "tcp/127.0.0.1:7447"
+            
+        Returns:
+            The same builder, for chaining
+            
+        Example:
+            >>> transport = UPTransportZenoh.builder("my-vehicle").listen("tcp/127.0.0.1:7447").build()
+        """
+        ...
+    
+    def connect(self, endpoint: str) -> UPTransportZenohBuilder:
+        """Add an endpoint this session connects to when it is built.
+        
+        May be called more than once.
+        
+        Args:
+            endpoint: A Zenoh locator such as "tcp/127.0.0.1:7447"
+            
+        Returns:
+            The same builder, for chaining
+            
+        Example:
+            >>> transport = UPTransportZenoh.builder("my-vehicle").connect("tcp/127.0.0.1:7447").build()
+        """
+        ...
+    
     def build(self) -> UPTransportZenoh:
         """Build the UPTransportZenoh instance.
         